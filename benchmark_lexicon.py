@@ -0,0 +1,87 @@
+import argparse
+import csv
+import os
+import random
+import string
+import time
+from src.scraper.google_review_scraper import GoogleReviewScraper
+from src.scraper.lexicon import Lexicon
+
+# Filler for synthetic reviews, customer-ish on its own
+FILLER_WORDS = (
+    'the a great place to and store was very friendly i bought some products service quick '
+    'delivery nice people price good bad never again would recommend helpful selection'
+).split()
+
+def legacy_filter(keywords, text):
+    """filter_employment_keywords as it was: one substring scan per keyword"""
+    keywords = dict(keywords)  # The old method rebuilt its dict literal on every call
+    text = text.lower()
+    score = sum(weight for keyword, weight in keywords.items()
+                if keyword in text)
+    return score >= 1.0
+
+def synthetic_reviews(count, keywords, employment_share, seed=0):
+    rng = random.Random(seed)
+    terms = list(keywords)
+    reviews = []
+    for _ in range(count):
+        words = rng.choices(FILLER_WORDS, k=rng.randint(20, 120))
+        if rng.random() < employment_share:
+            for _ in range(rng.randint(1, 4)):
+                words.insert(rng.randrange(len(words) + 1), rng.choice(terms))
+        reviews.append(' '.join(words).capitalize() + '.')
+    return reviews
+
+def csv_reviews(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return [row['pros'] if row.get('pros') not in (None, '', 'None provided') else row.get('cons', '')
+                for row in csv.DictReader(f)]
+
+def rate(func, reviews, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for review in reviews:
+            func(review)
+    return repeat * len(reviews) / (time.perf_counter() - started)
+
+def benchmark(title, lexicon, reviews, repeat):
+    keywords = lexicon.weights
+    mismatches = sum(legacy_filter(keywords, review) != lexicon.reaches(review, 1.0) for review in reviews)
+    legacy = rate(lambda review: legacy_filter(keywords, review), reviews, repeat)
+    reaches = rate(lambda review: lexicon.reaches(review, 1.0), reviews, repeat)
+    scan = rate(lexicon.scan, reviews, repeat)
+    print(f"\n📊 {title} ({len(keywords)} keywords, {len(reviews)} reviews)")
+    print(f"   old substring scans:  {legacy:>10,.0f} reviews/s")
+    print(f"   lexicon filter:       {reaches:>10,.0f} reviews/s ({reaches / legacy:.1f}x)")
+    print(f"   lexicon full scan:    {scan:>10,.0f} reviews/s ({scan / legacy:.1f}x, with terms and positions)")
+    if mismatches:
+        print(f"   ⚠️ {mismatches} reviews filtered differently")
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare the employment keyword lexicon with the old filter')
+    parser.add_argument('--reviews', type=int, default=5000, help='Synthetic reviews per benchmark')
+    parser.add_argument('--repeat', type=int, default=3, help='Passes over the reviews per measurement')
+    parser.add_argument('--input', help='Benchmark stored reviews from this CSV as well')
+    args = parser.parse_args()
+
+    lexicon = GoogleReviewScraper.EMPLOYMENT_KEYWORDS
+    for share in (0.1, 0.5, 0.9):
+        reviews = synthetic_reviews(args.reviews, lexicon.weights, share)
+        benchmark(f"{share:.0%} employment reviews", lexicon, reviews, args.repeat)
+
+    if args.input and os.path.isfile(args.input):
+        benchmark(f"Stored reviews from {args.input}", lexicon, csv_reviews(args.input), args.repeat)
+
+    # The old method grows with every keyword added; the lexicon mostly with the text
+    rng = random.Random(1)
+    for size in (200, 1000):
+        weights = dict(lexicon.weights)
+        while len(weights) < size:
+            weights[''.join(rng.choices(string.ascii_lowercase, k=rng.randint(5, 10)))] = 1
+        large = Lexicon(weights)
+        benchmark(f"Lexicon grown to {size} keywords", large,
+                  synthetic_reviews(args.reviews, lexicon.weights, 0.5), args.repeat)
+
+if __name__ == "__main__":
+    main()
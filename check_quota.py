@@ -2,6 +2,9 @@ import os
 from dotenv import load_dotenv
 import googlemaps
 from datetime import datetime
+from src.scraper.field_masks import request_skus
+from src.scraper.http_pool import get_http_pool
+from src.scraper.quota_ledger import QuotaLedger
 
 def main():
     # Load environment variables
@@ -12,8 +15,10 @@ def main():
     if not api_key:
         raise ValueError("Google Maps API key not found in .env.local")
     
-    # Initialize client
-    gmaps = googlemaps.Client(key=api_key)
+    # Initialize client and the local quota ledger shared with the scraper
+    gmaps = googlemaps.Client(key=api_key, requests_session=get_http_pool().requests_session())
+    budget = os.getenv('PLACES_DAILY_BUDGET')
+    ledger = QuotaLedger(daily_budget=float(budget) if budget else None)
     
     print(f"🔑 Using API key: {api_key[:4]}...{api_key[-4:]}")
     print("\n🔍 Testing API with a simple request...")
@@ -26,18 +31,25 @@ def main():
             fields=["place_id"]
         )
         
+        ledger.record(request_skus('findplacefromtext', ['place_id']))
+        
         print("\n✅ API is responding!")
         print(f"Response status: {result.get('status')}")
         
-        # Note: For actual quota information, you need to:
-        print("\n📊 To check detailed quota usage:")
-        print("1. Go to: https://console.cloud.google.com/apis/dashboard")
-        print("2. Select your project")
-        print("3. Click on 'Places API' under 'APIs and Services'")
-        print("4. View the Quotas tab")
-        
     except Exception as e:
         print(f"\n❌ Error: {str(e)}")
+    
+    # Usage recorded locally by every scraper run on this machine
+    print("\n📒 Local quota ledger (last 7 quota days, Pacific Time):")
+    ledger.report(days=7)
+    ledger.close()
+    
+    # Note: For authoritative quota information across machines, you need to:
+    print("\n📊 To check detailed quota usage:")
+    print("1. Go to: https://console.cloud.google.com/apis/dashboard")
+    print("2. Select your project")
+    print("3. Click on 'Places API' under 'APIs and Services'")
+    print("4. View the Quotas tab")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
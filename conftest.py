@@ -0,0 +1 @@
+"""Puts the repository root on sys.path so tests import the code as ``src.scraper``"""
@@ -0,0 +1,61 @@
+import argparse
+import csv
+import os
+import time
+from src.scraper.classifier import ClassificationExecutor
+
+def review_text(row):
+    """Review text stored in a CSV row's pros or cons column"""
+    for column in ('pros', 'cons'):
+        if row.get(column) and row[column] != 'None provided':
+            return row[column]
+    return ''
+
+def main():
+    parser = argparse.ArgumentParser(description='Re-score stored reviews with the current employment lexicon')
+    parser.add_argument('--input', default='company_reviews_new.csv', help='Reviews CSV to re-score')
+    parser.add_argument('--output', help='Where to write the re-scored CSV (default: <input>_rescored.csv)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Classifier processes (default: one per core, 0 to classify in-process)')
+    parser.add_argument('--batch-size', type=int, default=256, help='Reviews sent to a worker at a time')
+    args = parser.parse_args()
+
+    if not os.path.isfile(args.input):
+        raise ValueError(f"Reviews file not found: {args.input}")
+
+    with open(args.input, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        fieldnames = reader.fieldnames
+        rows = list(reader)
+
+    print(f"🔍 Re-scoring {len(rows)} reviews from {args.input}")
+    started = time.monotonic()
+    with ClassificationExecutor(workers=args.workers, batch_size=args.batch_size) as executor:
+        results = executor.classify([review_text(row) for row in rows])
+    elapsed = time.monotonic() - started
+
+    changed = 0
+    employment = 0
+    for row, (_, score, terms, position) in zip(rows, results):
+        if row.get('position') != position:
+            changed += 1
+        if terms:
+            employment += 1
+        row['position'] = position
+
+    # Never overwrite the tracked reviews file unless asked to
+    output_file = args.output or f"{os.path.splitext(args.input)[0]}_rescored.csv"
+    with open(output_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    rate = len(rows) / elapsed if elapsed else 0.0
+    print(f"\n📊 Re-scored {len(rows)} reviews in {elapsed:.2f}s ({rate:.0f} reviews/s, "
+          f"{executor.workers} workers)")
+    print(f"🔍 Reviews with employment terms: {employment}")
+    print(f"🔄 Positions changed: {changed}")
+    print(f"💾 Saved to {output_file}")
+
+if __name__ == "__main__":
+    main()
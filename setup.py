@@ -6,6 +6,7 @@ setup(
     packages=find_packages(),
     install_requires=[
         "python-dotenv==1.0.0",
-        "googlemaps==4.10.0"
+        "googlemaps==4.10.0",
+        "aiohttp==3.9.1"
     ],
 ) 
\ No newline at end of file
@@ -1,9 +1,39 @@
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+@dataclass
+class ApiKey:
+    key: str
+    requests_per_second: Optional[float] = None  # Defaults to GoogleAPIConfig.requests_per_second
+    daily_budget: Optional[float] = None  # USD per quota day for this key alone
+
 
 @dataclass
 class GoogleAPIConfig:
     api_key: str
+    base_url: str = 'https://maps.googleapis.com'  # Point at a mock server for offline load tests
     requests_per_second: int = 10
+    burst: Optional[int] = None  # Bucket size; defaults to one second of requests
+    endpoint_rates: Dict[str, float] = field(default_factory=dict)  # e.g. {'details': 5}
+    cache_dir: str = '.cache'  # Local caches and ledgers live here
+    place_id_max_age: Optional[float] = None  # Seconds before a cached place_id is re-resolved
+    fast_field_ttl: float = 86400  # Seconds cached reviews/rating stay fresh
+    slow_field_ttl: float = 30 * 86400  # Seconds cached name/address stay fresh
+    offline: bool = False  # Serve Places details only from the local cache
+    min_ratings_total: int = 1  # Staged fetch: skip places with fewer ratings than this
+    excluded_types: List[str] = field(default_factory=list)  # Staged fetch: skip places of these types
+    max_retries: int = 5  # Retries for throttled, 5xx and network failures
+    max_concurrency: int = 64  # Ceiling for the adaptive in-flight request limit
+    daily_budget: Optional[float] = None  # USD per Google quota day; runs stop cleanly when spent
+    cassette_mode: Optional[str] = None  # 'record' or 'replay' Places traffic via <cache_dir>/places.cassette.gz
+    cassette_time_scale: float = 1.0  # Replay speed: 1 keeps recorded timings, 0 replays instantly
+    pool_size: int = 100  # Keep-alive connections in the process-wide HTTP pool
+    warm_up_connections: int = 0  # Connections to open before the first call
+    api_keys: List[ApiKey] = field(default_factory=list)  # Extra keys; requests are spread over these and api_key
+    key_cooldown: float = 60  # Seconds a key rests after a quota error (doubles on repeats)
+    skip_unchanged: bool = False  # Skip reviews calls for places whose rating count hasn't moved since the last fetch
+    # Reviews are harvested under every sort x language pair; more than one pair costs a details call each
+    review_sorts: List[str] = field(default_factory=lambda: ['most_relevant'])  # 'most_relevant' and/or 'newest'
+    review_languages: List[Optional[str]] = field(default_factory=lambda: [None])  # e.g. [None, 'fr', 'zh']
     max_reviews: Optional[int] = None
-    min_rating: Optional[float] = None 
\ No newline at end of file
+    min_rating: Optional[float] = None
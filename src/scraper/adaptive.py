@@ -0,0 +1,151 @@
+import asyncio
+import random
+import time
+from typing import Optional
+
+import googlemaps
+
+# HTTP statuses that mean "slow down / try again" rather than a bad request
+RETRIABLE_HTTP_STATUSES = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(Exception):
+    """Raised when the circuit breaker's probes keep failing after repeated throttling or server errors"""
+
+
+def is_retriable(error: Exception) -> bool:
+    """Throttling, server and network errors are retried; other API errors are final"""
+    if isinstance(error, googlemaps.exceptions.HTTPError):
+        return error.status_code in RETRIABLE_HTTP_STATUSES
+    if isinstance(error, (googlemaps.exceptions.Timeout, googlemaps.exceptions.TransportError)):
+        return True
+    return isinstance(error, googlemaps.exceptions.ApiError) and error.status == 'OVER_QUERY_LIMIT'
+
+
+def is_quota_error(error: Exception) -> bool:
+    """The key itself is over its request quota, as opposed to a server or network failure"""
+    if isinstance(error, googlemaps.exceptions.HTTPError):
+        return error.status_code == 429
+    return isinstance(error, googlemaps.exceptions.ApiError) and error.status == 'OVER_QUERY_LIMIT'
+
+
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 30.0) -> float:
+    """Exponential backoff with equal jitter: half the window fixed, half random"""
+    window = min(cap, base * 2 ** attempt)
+    return window / 2 + random.uniform(0, window / 2)
+
+
+class AdaptiveController:
+    """AIMD concurrency limit with a circuit breaker for Places requests
+
+    The number of requests in flight is capped at ``limit``. It grows by
+    about ``increase`` per window of healthy responses (faster than
+    ``latency_target`` seconds) and is multiplied by ``decrease`` on
+    throttling, server errors or slow responses, at most once per
+    ``decrease_interval``. After ``failure_threshold`` consecutive failures
+    the circuit opens: requests wait ``reset_timeout`` seconds, then a
+    single probe is let through. The threshold should be above the
+    attempts one request makes, so a single bad place can't trip it.
+    Once ``max_failed_probes`` probes in a row have failed, acquire()
+    raises CircuitOpenError instead of waiting again.
+    """
+
+    def __init__(self, initial: float = 4, minimum: float = 1, maximum: float = 64,
+                 increase: float = 1, decrease: float = 0.5, latency_target: float = 2.0,
+                 decrease_interval: float = 1.0, failure_threshold: int = 12,
+                 reset_timeout: float = 30.0, max_failed_probes: int = 3):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_target = latency_target
+        self.decrease_interval = decrease_interval
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_failed_probes = max_failed_probes
+
+        self.in_flight = 0
+        self.state = 'closed'
+        self.peak_limit = self.limit
+        self.failures = 0
+        self.retries = 0
+        self.trips = 0
+        self._consecutive_failures = 0
+        self._failed_probes = 0
+        self._opened_at = 0.0
+        self._last_decrease = 0.0
+        self._condition: Optional[asyncio.Condition] = None
+
+    def _capacity(self) -> int:
+        return 1 if self.state == 'half_open' else max(1, int(self.limit))
+
+    def _open_for(self) -> float:
+        """Seconds until an open circuit lets a probe through; 0 once it may (now half-open)"""
+        if self.state != 'open':
+            return 0.0
+        if self._failed_probes >= self.max_failed_probes:
+            raise CircuitOpenError(
+                f"Circuit still open after {self._failed_probes} failed probes "
+                f"({self._consecutive_failures} consecutive failures)")
+        remaining = self.reset_timeout - (time.monotonic() - self._opened_at)
+        if remaining > 0:
+            return remaining
+        self.state = 'half_open'
+        return 0.0
+
+    async def acquire(self):
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        async with self._condition:
+            while True:
+                wait = self._open_for()
+                if wait > 0:
+                    try:
+                        await asyncio.wait_for(self._condition.wait(), wait)
+                    except asyncio.TimeoutError:
+                        pass
+                elif self.in_flight >= self._capacity():
+                    await self._condition.wait()
+                else:
+                    break
+            self.in_flight += 1
+
+    async def release(self):
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def _back_off(self):
+        now = time.monotonic()
+        if now - self._last_decrease >= self.decrease_interval:
+            self.limit = max(self.minimum, self.limit * self.decrease)
+            self._last_decrease = now
+
+    def on_success(self, latency: float):
+        self._consecutive_failures = 0
+        self._failed_probes = 0
+        if self.state == 'half_open':
+            self.state = 'closed'
+        if latency > self.latency_target:
+            self._back_off()
+        else:
+            self.limit = min(self.maximum, self.limit + self.increase / self.limit)
+            self.peak_limit = max(self.peak_limit, self.limit)
+
+    def on_failure(self):
+        self.failures += 1
+        self._consecutive_failures += 1
+        self._back_off()
+        if self.state == 'half_open':
+            self._failed_probes += 1
+        if self.state == 'half_open' or self._consecutive_failures >= self.failure_threshold:
+            if self.state != 'open':
+                self.trips += 1
+            self.state = 'open'
+            self._opened_at = time.monotonic()
+
+    def report(self):
+        print(f"⚙️ Adaptive concurrency settled at {int(self.limit)} (peak {int(self.peak_limit)}): "
+              f"{self.failures} throttled/failed responses, {self.retries} retries, "
+              f"{self.trips} circuit trips")
@@ -0,0 +1,138 @@
+import asyncio
+import gzip
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+
+from .response_cache import _IGNORED_PARAMS
+
+
+class CassetteMiss(Exception):
+    """Raised in replay mode when a request was never recorded"""
+
+
+class Cassette:
+    """Records Places request/response pairs to a gzipped JSON-lines file and replays them
+
+    Requests are keyed on path and sorted query without the API key, so a
+    cassette can be shared and replayed with any key. Identical requests
+    recorded several times are replayed in order, wrapping around. Replay
+    sleeps for the recorded response time multiplied by ``time_scale``
+    (0 replays as fast as possible).
+    """
+
+    def __init__(self, path: str = '.cache/places.cassette.gz', mode: str = 'replay',
+                 time_scale: float = 1.0):
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"Cassette mode must be 'record' or 'replay', not {mode!r}")
+        self.path = path
+        self.mode = mode
+        self.time_scale = time_scale
+        self.recorded = 0
+        self.replayed = 0
+        self._entries: Dict[str, List[Dict]] = defaultdict(list)
+        self._positions: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        if mode == 'replay':
+            self._load()
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == 'replay'
+
+    @staticmethod
+    def make_key(url: str) -> str:
+        parts = urlsplit(url)
+        params = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                        if k not in _IGNORED_PARAMS)
+        return f"{parts.path}?{urlencode(params)}"
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(f"No cassette at {self.path}; record one first")
+        with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                entry = json.loads(line)
+                self._entries[entry['request']].append(entry)
+
+    def save(self):
+        if self.replaying:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with self._lock, gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            for entries in self._entries.values():
+                for entry in entries:
+                    f.write(json.dumps(entry, separators=(',', ':')) + '\n')
+        os.replace(tmp_path, self.path)
+
+    def record(self, url: str, status_code: int, body: str, elapsed: float):
+        entry = {'request': self.make_key(url), 'status': status_code,
+                 'elapsed': round(elapsed, 4), 'body': body}
+        with self._lock:
+            self._entries[entry['request']].append(entry)
+            self.recorded += 1
+
+    def _next(self, url: str) -> Dict:
+        key = self.make_key(url)
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                raise CassetteMiss(f"Request not in cassette: {key}")
+            entry = entries[self._positions[key] % len(entries)]
+            self._positions[key] += 1
+            self.replayed += 1
+        return entry
+
+    def replay(self, url: str) -> Tuple[int, str]:
+        entry = self._next(url)
+        if self.time_scale:
+            time.sleep(entry['elapsed'] * self.time_scale)
+        return entry['status'], entry['body']
+
+    async def replay_async(self, url: str) -> Tuple[int, str]:
+        entry = self._next(url)
+        if self.time_scale:
+            await asyncio.sleep(entry['elapsed'] * self.time_scale)
+        return entry['status'], entry['body']
+
+    def session(self) -> requests.Session:
+        """requests.Session for ``googlemaps.Client(requests_session=...)`` that goes through this cassette"""
+        return CassetteSession(self)
+
+    def report(self):
+        if self.replaying:
+            print(f"📼 Cassette: {self.replayed} responses replayed from {self.path}")
+        else:
+            print(f"📼 Cassette: {self.recorded} responses recorded to {self.path}")
+
+
+class CassetteSession(requests.Session):
+    """requests.Session that records or replays GETs through a Cassette"""
+
+    def __init__(self, cassette: Cassette):
+        super().__init__()
+        self.cassette = cassette
+
+    def get(self, url, **kwargs):
+        if not self.cassette.replaying:
+            response = super().get(url, **kwargs)
+            self.cassette.record(response.url, response.status_code, response.text,
+                                 response.elapsed.total_seconds())
+            return response
+
+        status_code, body = self.cassette.replay(url)
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = body.encode('utf-8')
+        response.encoding = 'utf-8'
+        response.url = url
+        return response
@@ -0,0 +1,68 @@
+import json
+import os
+from typing import Any, Dict, Optional, Tuple
+
+
+class CheckpointJournal:
+    """Append-only JSON-lines journal of work a run has finished, for resuming it
+
+    Entries are ``(kind, key) -> value``, e.g. a checked place with its
+    reviews, a place whose snapshot was recorded, or a CSV row already
+    written. Each entry is flushed and fsynced before the run
+    moves on, so a cancelled or crashed run loses at most the call in
+    flight. Without ``resume`` any earlier journal is discarded; finish()
+    deletes the journal once the run completes.
+    """
+
+    def __init__(self, path: str, resume: bool = False):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.resumed = 0
+        self._entries: Dict[Tuple[str, str], Any] = {}
+        if resume and os.path.exists(path):
+            # Cut a torn final line, or new entries would be appended after it and lost with it
+            os.truncate(path, self._load())
+            print(f"⏯️ Resuming from checkpoint {path} ({len(self._entries)} entries)")
+        self._file = open(path, 'a' if resume else 'w', encoding='utf-8')
+
+    def _load(self) -> int:
+        """Read the journal's entries; returns the byte length of its intact lines"""
+        intact = 0
+        with open(self.path, 'rb') as f:
+            for line in f:
+                # A torn final line from a crash mid-write ends the intact part
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                self._entries[(entry['kind'], entry['key'])] = entry['value']
+                intact += len(line)
+        return intact
+
+    def get(self, kind: str, key: str) -> Optional[Any]:
+        value = self._entries.get((kind, key))
+        if value is not None:
+            self.resumed += 1
+        return value
+
+    def put(self, kind: str, key: str, value: Any):
+        self._entries[(kind, key)] = value
+        self._file.write(json.dumps({'kind': kind, 'key': key, 'value': value}, default=str) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def finish(self):
+        """The run completed; nothing is left to resume"""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        if self.resumed:
+            print(f"⏯️ Checkpoint saved {self.resumed} repeated steps")
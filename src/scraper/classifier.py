@@ -0,0 +1,170 @@
+import asyncio
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+# Employment-related terms to highlight with weights
+HIGHLIGHT_TERMS = {
+    # High priority terms (weight: 8)
+    'interview': 8,
+    'interviewed': 8,
+    'hiring': 8,
+    'hired': 8,
+    'fired': 8,
+    'laid off': 8,
+    'layoff': 8,
+    'salary': 8,
+    'wage': 8,
+    'compensation': 8,
+
+    # Work environment terms (weight: 6)
+    'workplace': 6,
+    'work': 6,
+    'working': 6,
+    'employee': 6,
+    'employer': 6,
+    'management': 6,
+    'manager': 6,
+    'supervisor': 6,
+    'boss': 6,
+    'hr': 6,
+    'human resources': 6,
+
+    # Culture terms (weight: 5)
+    'culture': 5,
+    'environment': 5,
+    'toxic': 5,
+    'benefits': 5,
+    'insurance': 5,
+    'vacation': 5,
+    'pto': 5,
+    'work-life': 5,
+
+    # Role terms (weight: 4)
+    'position': 4,
+    'role': 4,
+    'job': 4,
+    'staff': 4,
+    'team': 4,
+    'coworker': 4,
+    'colleague': 4,
+    'department': 4,
+
+    # General terms (weight: 3)
+    'company': 3,
+    'business': 3,
+    'corporate': 3,
+    'office': 3,
+    'professional': 3,
+    'career': 3,
+    'training': 3
+}
+
+# Employee indicators
+EMPLOYEE_TERMS = [
+    'i work', 'worked here', 'working here', 'my job', 'my role',
+    'my position', 'my manager', 'my supervisor', 'my team',
+    'my department', 'my coworkers', 'my colleagues',
+    'interviewed', 'got hired', 'got fired', 'laid off',
+    'my salary', 'my wage', 'employee', 'employer'
+]
+
+# Customer indicators
+CUSTOMER_TERMS = [
+    'bought', 'purchased', 'ordered', 'customer service',
+    'shopping', 'shop', 'store', 'retail', 'service',
+    'product quality', 'delivery', 'ordered online'
+]
+
+# (term, weight, pattern), compiled once per process
+_LEXICON: Optional[List[Tuple[str, int, 're.Pattern']]] = None
+
+
+def _lexicon() -> List[Tuple[str, int, 're.Pattern']]:
+    global _LEXICON
+    if _LEXICON is None:
+        _LEXICON = [
+            (term, weight, re.compile(r'\b' + term + r'\b', re.IGNORECASE))
+            for term, weight in HIGHLIGHT_TERMS.items()
+        ]
+    return _LEXICON
+
+
+def highlight_employment_terms(text: str) -> Tuple[str, int, List[str]]:
+    """Review text with employment terms in [BRACKETS], its weighted score and the terms found"""
+    highlighted_text = text
+    score = 0
+    found_terms = []
+
+    for term, weight, pattern in _lexicon():
+        if pattern.search(text):
+            highlighted_text = pattern.sub(f'[{term.upper()}]', highlighted_text)
+            score += weight
+            found_terms.append(term)
+
+    return highlighted_text, score, found_terms
+
+
+def detect_position(text: str) -> str:
+    """Enhanced position detection with more specific criteria."""
+    text_lower = text.lower()
+
+    # Check for employee terms first (higher priority)
+    if any(term in text_lower for term in EMPLOYEE_TERMS):
+        return 'Employee'
+    elif any(term in text_lower for term in CUSTOMER_TERMS):
+        return 'Customer'
+
+    return 'Google Reviewer'
+
+
+def classify_batch(texts: List[str]) -> List[Tuple[str, int, List[str], str]]:
+    """(highlighted text, score, terms, position) for each text"""
+    results = []
+    for text in texts:
+        highlighted_text, score, terms = highlight_employment_terms(text)
+        results.append((highlighted_text, score, terms, detect_position(text)))
+    return results
+
+
+class ClassificationExecutor:
+    """Classifies review texts in batches on a process pool
+
+    Each worker compiles the lexicon once when it starts, and texts travel
+    in batches of ``batch_size`` to keep pickling overhead per review low.
+    With ``workers=0`` batches run in-process instead.
+    """
+
+    def __init__(self, workers: Optional[int] = None, batch_size: int = 256):
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.batch_size = batch_size
+        self._pool = ProcessPoolExecutor(self.workers, initializer=_lexicon) if self.workers else None
+
+    def _batches(self, texts: List[str]) -> List[List[str]]:
+        return [texts[i:i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
+
+    def classify(self, texts: List[str]) -> List[Tuple[str, int, List[str], str]]:
+        if self._pool is None:
+            return classify_batch(texts)
+        return [result for batch in self._pool.map(classify_batch, self._batches(texts)) for result in batch]
+
+    async def classify_async(self, texts: List[str]) -> List[Tuple[str, int, List[str], str]]:
+        """Like classify() without blocking the event loop"""
+        if self._pool is None:
+            return await asyncio.to_thread(classify_batch, texts)
+        loop = asyncio.get_running_loop()
+        batches = await asyncio.gather(*(
+            loop.run_in_executor(self._pool, classify_batch, batch) for batch in self._batches(texts)
+        ))
+        return [result for batch in batches for result in batch]
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,102 @@
+from collections import Counter
+from typing import Dict, List, Optional
+
+from googlemaps import places as gmaps_places
+
+# Legacy Places API list prices in USD per 1000 billable events; adjust to your contract
+SKU_PRICES_PER_1000 = {
+    'Place Details': 17.0,
+    'Find Place': 17.0,
+    'Nearby Search': 32.0,
+    'Text Search': 32.0,
+    'Basic Data': 0.0,
+    'Contact Data': 3.0,
+    'Atmosphere Data': 5.0,
+}
+
+# Cheap Basic Data detail fields used to decide whether a place is worth paying for reviews
+BASIC_PREFILTER_FIELDS = ['business_status', 'type']
+
+_ENDPOINT_SKUS = {
+    'details': 'Place Details',
+    'findplacefromtext': 'Find Place',
+    'nearbysearch': 'Nearby Search',
+    'textsearch': 'Text Search',
+}
+
+_DATA_SKUS = {
+    'details': [
+        ('Basic Data', gmaps_places.PLACES_DETAIL_FIELDS_BASIC),
+        ('Contact Data', gmaps_places.PLACES_DETAIL_FIELDS_CONTACT),
+        ('Atmosphere Data', gmaps_places.PLACES_DETAIL_FIELDS_ATMOSPHERE),
+    ],
+    'findplacefromtext': [
+        ('Basic Data', gmaps_places.PLACES_FIND_FIELDS_BASIC),
+        ('Contact Data', gmaps_places.PLACES_FIND_FIELDS_CONTACT),
+        ('Atmosphere Data', gmaps_places.PLACES_FIND_FIELDS_ATMOSPHERE),
+    ],
+}
+
+# Requested field names whose key in the response differs
+_RESULT_KEYS = {
+    'review': 'reviews', 'photo': 'photos', 'type': 'types',
+    'address_component': 'address_components'
+}
+
+
+def result_key(field: str) -> str:
+    """Key a requested field appears under in a place result ('geometry/location' -> 'geometry')"""
+    field = field.split('/')[0]
+    return _RESULT_KEYS.get(field, field)
+
+
+def request_skus(endpoint: str, fields: Optional[List[str]] = None) -> List[str]:
+    """SKUs billed for one call; searches and unmasked calls bill every data tier"""
+    skus = [_ENDPOINT_SKUS.get(endpoint, endpoint)]
+    tiers = _DATA_SKUS.get(endpoint)
+    if tiers is None or not fields:
+        return skus + ['Basic Data', 'Contact Data', 'Atmosphere Data']
+    return skus + [sku for sku, tier_fields in tiers if tier_fields & set(fields)]
+
+
+def params_skus(endpoint: str, params: Dict) -> List[str]:
+    """SKUs billed for a call with these (googlemaps-encoded) request params"""
+    fields = params['fields'].split(',') if params.get('fields') else None
+    return request_skus(endpoint, fields)
+
+
+class CostTracker:
+    """Counts billed Places calls per SKU and estimates their cost
+
+    With a QuotaLedger attached, every call is also written to the ledger
+    and check() enforces its daily budget before the call is sent,
+    reserving the cost until release().
+    """
+
+    def __init__(self, prices: Optional[Dict[str, float]] = None, ledger=None):
+        self.prices = prices or SKU_PRICES_PER_1000
+        self.ledger = ledger
+        self.calls = Counter()
+
+    def check(self, endpoint: str, params: Dict) -> float:
+        if self.ledger is not None:
+            return self.ledger.check(params_skus(endpoint, params))
+        return 0.0
+
+    def release(self, reserved: float):
+        if self.ledger is not None:
+            self.ledger.release(reserved)
+
+    def record(self, endpoint: str, params: Dict):
+        skus = params_skus(endpoint, params)
+        self.calls.update(skus)
+        if self.ledger is not None:
+            self.ledger.record(skus)
+
+    def estimated_cost(self) -> float:
+        return sum(count * self.prices.get(sku, 0.0) / 1000 for sku, count in self.calls.items())
+
+    def report(self):
+        print(f"💰 Estimated API cost this session: ${self.estimated_cost():.4f}")
+        for sku, count in sorted(self.calls.items()):
+            print(f"   {sku}: {count} calls")
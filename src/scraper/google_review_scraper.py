@@ -1,148 +1,674 @@
 import googlemaps
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 import asyncio
+import contextlib
+import json
+import os
+from collections import Counter
+
+from .places_client import AsyncPlacesClient
+from .request_planner import RequestPlanner
+from .place_id_cache import PlaceIdCache
+from .response_cache import ResponseCache
+from .field_masks import BASIC_PREFILTER_FIELDS, CostTracker, result_key
+from .region_sweep import RegionSweeper
+from .adaptive import AdaptiveController, CircuitOpenError
+from .quota_ledger import BudgetExhausted, QuotaLedger
+from .cassette import Cassette
+from .http_pool import get_http_pool
+from .key_pool import KeyPool
+from .place_snapshots import PlaceSnapshots
+from .checkpoint import CheckpointJournal
+from .lexicon import Lexicon
+
+try:
+    from ..config.api_config import GoogleAPIConfig
+except ImportError:  # Imported as the top-level ``scraper`` package from src/
+    from config.api_config import GoogleAPIConfig
 
 class GoogleReviewScraper:
-    def __init__(self, api_key: str):
-        self.client = googlemaps.Client(key=api_key)
+    # Detail fields needed to build a review row
+    REVIEW_FIELDS = ['name', 'formatted_address', 'rating', 'reviews', 'user_ratings_total']
+
+    # Weighted employment keywords, compiled once for every scraper
+    EMPLOYMENT_KEYWORDS = Lexicon({
+        # Direct employment terms (highest weight)
+        'workplace': 3,
+        'worked here': 3,
+        'working here': 3,
+        'employee': 3,
+        'employer': 3,
+        'employed': 3,
+        'salary': 3,
+        'wage': 3,
+        'wages': 3,
+        
+        # Industry specific terms (high weight)
+        'cultivation': 2.5,
+        'growing': 2.5,
+        'processing': 2.5,
+        'packaging': 2.5,
+        'production': 2.5,
+        'quality control': 2.5,
+        'compliance': 2.5,
+        'facility': 2.5,
+        
+        # Work environment terms (medium-high weight)
+        'management': 2,
+        'supervisor': 2,
+        'manager': 2,
+        'benefits': 2,
+        'work-life': 2,
+        'work life': 2,
+        'shifts': 2,
+        'coworkers': 2,
+        'co-workers': 2,
+        
+        # General work terms (medium weight)
+        'job': 1.5,
+        'pay': 1.5,
+        'staff': 1.5,
+        'team': 1.5,
+        'hours': 1.5,
+        'schedule': 1.5,
+        'position': 1.5,
+        
+        # Culture and environment (standard weight)
+        'toxic': 1,
+        'culture': 1,
+        'environment': 1,
+        'training': 1,
+        'experience': 1,
+        'safety': 1,
+        'clean': 1
+    })
+
+    def __init__(self, api_key: str, config: Optional[GoogleAPIConfig] = None):
+        self.config = config or GoogleAPIConfig(api_key=api_key)
+        self.cassette = None
+        if self.config.cassette_mode:
+            self.cassette = Cassette(
+                os.path.join(self.config.cache_dir, 'places.cassette.gz'),
+                mode=self.config.cassette_mode,
+                time_scale=self.config.cassette_time_scale
+            )
+        replaying = self.cassette is not None and self.cassette.replaying
+        # Connections are shared by every scraper in the process
+        self.http_pool = get_http_pool(self.config.pool_size)
+        # Blocking client, kept for sync callers
+        self.client = googlemaps.Client(
+            key=api_key, queries_per_second=self.config.requests_per_second, base_url=self.config.base_url,
+            requests_session=self.cassette.session() if self.cassette else self.http_pool.requests_session()
+        )
+        self.response_cache = ResponseCache(
+            os.path.join(self.config.cache_dir, 'responses.sqlite'),
+            fast_ttl=self.config.fast_field_ttl,
+            slow_ttl=self.config.slow_field_ttl,
+            offline=self.config.offline
+        )
+        self.quota_ledger = QuotaLedger(
+            os.path.join(self.config.cache_dir, 'quota_ledger.sqlite'),
+            daily_budget=self.config.daily_budget
+        )
+        # Requests are spread over every configured key, each under its own rate limit and budget
+        self.key_pool = KeyPool.from_config(self.config, ledger=self.quota_ledger)
+        # Replayed calls are free and unthrottled; with a cassette every call must reach it,
+        # so a recording isn't missing what the response cache would have answered
+        self.cost_tracker = CostTracker(ledger=None if replaying else self.quota_ledger)
+        self.places = AsyncPlacesClient(api_key, base_url=self.config.base_url,
+                                        key_pool=None if replaying else self.key_pool,
+                                        response_cache=None if self.cassette else self.response_cache,
+                                        cost_tracker=self.cost_tracker,
+                                        max_retries=self.config.max_retries,
+                                        # Above one request's attempts, so a single failing place can't trip the breaker
+                                        controller=AdaptiveController(
+                                            maximum=self.config.max_concurrency,
+                                            failure_threshold=2 * (self.config.max_retries + 1)
+                                        ),
+                                        cassette=self.cassette,
+                                        http_pool=self.http_pool)
+        self.place_snapshots = PlaceSnapshots(os.path.join(self.config.cache_dir, 'place_snapshots.sqlite'))
+        self.place_id_cache = PlaceIdCache(
+            os.path.join(self.config.cache_dir, 'place_ids.json'),
+            max_age=self.config.place_id_max_age
+        )
+        # Reviews per harvest variant, and how many of those earlier variants had not returned
+        self.variant_reviews = Counter()
+        self.variant_added = Counter()
         self.location = {
             'lat': 49.2163,  # Pitt Meadows coordinates
             'lng': -122.6894
         }
         self.search_radius = 15000  # 15km radius to cover both Pitt Meadows and nearby areas
+        self.page_token_delay = 2.0  # next_page_token takes a moment to become valid
+        self.page_token_retries = 3
+
+    async def close(self):
+        """Release pooled connections and local databases"""
+        await self.places.close()
+        if self.cassette is not None:
+            self.cassette.save()
+        self.response_cache.close()
+        self.quota_ledger.close()
+        self.place_snapshots.close()
+
+    async def warm_up(self):
+        """Open ``config.warm_up_connections`` pooled connections before the first real call"""
+        if self.config.warm_up_connections and not (self.cassette and self.cassette.replaying):
+            await self.http_pool.warm_up(self.config.base_url, self.config.warm_up_connections)
+
+    async def __aenter__(self):
+        await self.warm_up()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
         
     def filter_employment_keywords(self, text: str) -> bool:
         """Enhanced employment keyword detection"""
-        keywords = {
-            # Direct employment terms (highest weight)
-            'workplace': 3,
-            'worked here': 3,
-            'working here': 3,
-            'employee': 3,
-            'employer': 3,
-            'employed': 3,
-            'salary': 3,
-            'wage': 3,
-            'wages': 3,
+        return self.EMPLOYMENT_KEYWORDS.reaches(text, 1.0)  # Lower threshold to catch more reviews
+
+    def _report_run(self, planner: RequestPlanner):
+        planner.report()
+        self.response_cache.report()
+        if self.config.skip_unchanged:
+            self.place_snapshots.report()
+        self.cost_tracker.report()
+        self.places.single_flight.report()
+        self.places.controller.report()
+        self.quota_ledger.report()
+        self.key_pool.report()
+        self.http_pool.report()
+        if self.cassette is not None:
+            self.cassette.report()
+        if self.variant_reviews:
+            self._report_variants()
+
+    def _report_variants(self):
+        print("🌐 Review harvest variants (reviews returned / new reviews added, in config order):")
+        for variant in self.variant_reviews:
+            print(f"   {variant}: {self.variant_reviews[variant]} / {self.variant_added[variant]}")
+
+    def _review_variants(self) -> List[Tuple[str, Optional[str]]]:
+        return [(sort, language) for sort in self.config.review_sorts for language in self.config.review_languages]
+
+    async def harvest_reviews(self, place_id: str, variants: Optional[List[Tuple[str, Optional[str]]]] = None,
+                              fields: Optional[List[str]] = None) -> Dict:
+        """Fetch a place's reviews under several (sort, language) variants at once and merge them
+
+        Each details call returns at most 5 reviews, so different sorts and
+        languages surface different ones. Reviews are merged on (author,
+        time), newest first; each variant is credited with the reviews no
+        earlier variant in the list returned. Other ``fields`` ride along
+        with the first variant's call; its result is returned with the
+        merged reviews.
+        """
+        variants = variants or self._review_variants()
+        extra_fields = [field for field in fields or [] if result_key(field) != 'reviews']
+        responses = await asyncio.gather(*(
+            self.places.place(place_id, fields=['reviews'] + (extra_fields if i == 0 else []), reviews_sort=sort,
+                              language=language, reviews_no_translations=True)
+            for i, (sort, language) in enumerate(variants)
+        ))
+
+        found = {}
+        for (sort, language), response in zip(variants, responses):
+            variant = f"{sort}/{language or 'default'}"
+            for review in response.get('result', {}).get('reviews', []):
+                self.variant_reviews[variant] += 1
+                identity = (review.get('author_name'), review.get('time'))
+                if identity not in found:
+                    found[identity] = review
+                    self.variant_added[variant] += 1
+
+        result = dict(responses[0].get('result', {}))
+        result['reviews'] = sorted(found.values(), key=lambda review: review.get('time', 0), reverse=True)
+        return result
+
+    def _worth_reviews(self, place: Dict) -> bool:
+        """Cheap predicates on search/Basic Data fields; unknown values pass"""
+        if place.get('business_status', 'OPERATIONAL') != 'OPERATIONAL':
+            return False
+        if place.get('user_ratings_total', self.config.min_ratings_total) < self.config.min_ratings_total:
+            return False
+        return not set(place.get('types', [])) & set(self.config.excluded_types)
+
+    async def _check_place(self, place: Dict, planner: RequestPlanner, staged: bool = False,
+                           journal: Optional[CheckpointJournal] = None) -> Tuple[List[Dict], Optional[Dict]]:
+        """Look up one nearby result and return its employment-related reviews and snapshot
+
+        Places already finished in ``journal`` are answered from it without
+        any API call; newly finished places are added to it.
+        """
+        business_name = place.get('name', 'Unknown Business')
+        place_id = place.get('place_id')
+        if journal is not None and place_id:
+            done = journal.get('place', place_id)
+            if done is not None:
+                print(f"⏯️ Already checked: {business_name}")
+                return done['reviews'], done['snapshot']
+        
+        print(f"🏢 Checking: {business_name}")
+        try:
+            reviews, snapshot = await self._lookup_place_reviews(place, planner, staged)
+        except (CircuitOpenError, BudgetExhausted):
+            raise
+        except Exception as place_error:
+            print(f"⚠️ Error checking {business_name}: {str(place_error)}")
+            return [], None
+        
+        if journal is not None and place_id:
+            journal.put('place', place_id, {'reviews': reviews, 'snapshot': snapshot})
+        return reviews, snapshot
+
+    def _finish_place(self, snapshot: Dict, employment_reviews: int):
+        """Every review of a looked-up place reached the caller; remember what was seen"""
+        self.quota_ledger.record_yield(snapshot['place_id'], employment_reviews)
+        self.place_snapshots.put(snapshot['place_id'], snapshot['user_ratings_total'], snapshot['rating'])
+
+    def _finish_journaled_place(self, snapshot: Dict, employment_reviews: int,
+                                journal: Optional[CheckpointJournal]):
+        """_finish_place, once per place even when a resumed run replays it from ``journal``"""
+        if journal is not None and journal.get('finished', snapshot['place_id']):
+            return
+        self._finish_place(snapshot, employment_reviews)
+        if journal is not None:
+            journal.put('finished', snapshot['place_id'], True)
+
+    async def _lookup_place_reviews(self, place: Dict, planner: RequestPlanner,
+                                    staged: bool) -> Tuple[List[Dict], Optional[Dict]]:
+        """Employment-related reviews of one place, with its snapshot when reviews were fetched
+
+        In ``staged`` mode the Basic Data fields are fetched first and the
+        Atmosphere-priced reviews call is only made for places that pass
+        _worth_reviews. With ``config.skip_unchanged`` places whose search
+        result rating count matches the last fetch are skipped outright.
+        The snapshot is left to the caller (see _finish_place) so a place is
+        only marked as seen once its reviews have actually been used.
+        """
+        business_name = place.get('name', 'Unknown Business')
+        reviews = []
+        review_calls = len(self._review_variants())  # Details calls per place when reviews are harvested
+        
+        if planner.plan_lookup(place):
+            # Only fall back to text search when the nearby result has no place_id
+            search_result = await self.places.places(
+                query=f"{business_name} Delta BC",
+                location=self.location,
+                radius=5000
+            )
+            if not search_result.get('results'):
+                return reviews, None
+            place = {**place, **search_result['results'][0]}
+        
+        if place.get('place_id') and self.config.skip_unchanged and self.place_snapshots.is_unchanged(place):
+            planner.skip_details(calls=review_calls)
+            print(f"⏭️ Skipping {business_name}: no new ratings since the last run")
+            return reviews, None
+        
+        if place.get('place_id') and staged:
+            basic_fields = planner.plan_prefetch(place, BASIC_PREFILTER_FIELDS)
+            if basic_fields:
+                place = {**place, **(await self.places.place(
+                    place['place_id'],
+                    fields=basic_fields
+                )).get('result', {})}
+            if not self._worth_reviews(place):
+                planner.skip_details(calls=review_calls)
+                print(f"⏭️ Skipping {business_name}: not worth a reviews lookup")
+                return reviews, None
+        
+        snapshot = None
+        if place.get('place_id'):
+            # Get only the detail fields the search result didn't already give us
+            place_details = dict(place)
+            missing_fields = planner.plan_details(place, self.REVIEW_FIELDS, calls=review_calls)
+            if 'reviews' in missing_fields and review_calls > 1:
+                # The other missing fields come back with the first variant's call
+                place_details.update(await self.harvest_reviews(place['place_id'], fields=missing_fields))
+            elif missing_fields:
+                place_details.update((await self.places.place(
+                    place['place_id'],
+                    fields=missing_fields
+                )).get('result', {}))
+            
+            if place_details.get('reviews'):
+                print(f"📝 Found {len(place_details['reviews'])} reviews")
+                
+                for review in place_details['reviews']:
+                    if self.filter_employment_keywords(review['text']):
+                        reviews.append({
+                            'business_name': place_details['name'],
+                            'address': place_details.get('formatted_address', 'Address not available'),
+                            'text': review['text'],
+                            'rating': review['rating'],
+                            'time': review['relative_time_description'],
+                            'author': review['author_name'],
+                            'employment_related': True
+                        })
+            else:
+                print(f"ℹ️ No reviews available")
             
-            # Industry specific terms (high weight)
-            'cultivation': 2.5,
-            'growing': 2.5,
-            'processing': 2.5,
-            'packaging': 2.5,
-            'production': 2.5,
-            'quality control': 2.5,
-            'compliance': 2.5,
-            'facility': 2.5,
+            if 'reviews' in missing_fields:
+                snapshot = {
+                    'place_id': place['place_id'],
+                    'user_ratings_total': place_details.get('user_ratings_total'),
+                    'rating': place_details.get('rating')
+                }
+        
+        return reviews, snapshot
+
+    async def _fetch_next_page(self, page_token: str) -> Dict:
+        """Wait for a next_page_token to become valid, then fetch that page"""
+        for attempt in range(self.page_token_retries):
+            await asyncio.sleep(self.page_token_delay)
+            try:
+                return await self.places.places_nearby(page_token=page_token)
+            except googlemaps.exceptions.ApiError as e:
+                # Google answers INVALID_REQUEST until the token is ready
+                if e.status != 'INVALID_REQUEST' or attempt == self.page_token_retries - 1:
+                    raise
+
+    async def _iter_nearby_places(self, max_pages: int = 3, **params):
+        """Yield nearby search results as each page arrives, following next_page_token
+
+        Pages are never checkpointed: their tokens expire within minutes,
+        so a resumed run searches again and skips the places it finished.
+        """
+        page = 1
+        response = await self.places.places_nearby(**params)
+        
+        while True:
+            results = response.get('results', [])
+            if page == 1 and not results:
+                print(f"📍 No places found matching '{params.get('keyword')}'")
+            else:
+                print(f"📍 Page {page}: found {len(results)} places to check...")
             
-            # Work environment terms (medium-high weight)
-            'management': 2,
-            'supervisor': 2,
-            'manager': 2,
-            'benefits': 2,
-            'work-life': 2,
-            'work life': 2,
-            'shifts': 2,
-            'coworkers': 2,
-            'co-workers': 2,
+            for place in results:
+                yield place
             
-            # General work terms (medium weight)
-            'job': 1.5,
-            'pay': 1.5,
-            'staff': 1.5,
-            'team': 1.5,
-            'hours': 1.5,
-            'schedule': 1.5,
-            'position': 1.5,
+            page_token = response.get('next_page_token')
+            if not page_token or page >= max_pages:
+                return
             
-            # Culture and environment (standard weight)
-            'toxic': 1,
-            'culture': 1,
-            'environment': 1,
-            'training': 1,
-            'experience': 1,
-            'safety': 1,
-            'clean': 1
-        }
+            page += 1
+            try:
+                response = await self._fetch_next_page(page_token)
+            except Exception as page_error:
+                print(f"⚠️ Could not fetch page {page}: {str(page_error)}")
+                return
+
+    async def _search_circle(self, location: Dict, radius: float, keyword: str = None,
+                             place_type: str = None, max_pages: int = 3) -> List[Dict]:
+        """Every nearby result for one search circle, across all pages"""
+        return [
+            place async for place in self._iter_nearby_places(
+                max_pages=max_pages, location=location, radius=int(radius),
+                keyword=keyword, type=place_type
+            )
+        ]
+
+    async def sweep_region(self, area, keyword: str = None, place_type: str = None,
+                           concurrency: int = 8, min_radius: float = 250) -> List[Dict]:
+        """Find every place in a BoundingBox or (lat, lng) polygon, beyond the 60-result cap
+
+        See RegionSweeper; returns places deduplicated by place_id.
+        """
+        sweeper = RegionSweeper(
+            lambda location, radius: self._search_circle(location, radius, keyword, place_type),
+            concurrency=concurrency,
+            min_radius=min_radius
+        )
+        places = await sweeper.sweep(area)
+        sweeper.report()
+        print(f"📍 Found {len(places)} unique places")
+        return places
+
+    async def _iter_place_reviews(self, places, concurrency: int, check_place):
+        """Check places through a bounded pool, yielding each one's reviews as it completes
+
+        ``places`` is an async iterable, so lookups start while later search
+        pages are still being fetched. ``check_place`` is awaited per place.
+        A place holds one of ``concurrency`` slots from before its lookup
+        until the caller takes its result, so a slow caller pauses new
+        lookups instead of letting results pile up.
+        """
+        slots = asyncio.Semaphore(concurrency)
+        finished = asyncio.Queue()
+        tasks = set()
+        started = 0
+        
+        async def check(place):
+            try:
+                result = await check_place(place)
+            except Exception as e:
+                result = e  # Re-raised to the consumer below
+            await finished.put(result)
+        
+        async def feed():
+            nonlocal started
+            async for place in places:
+                await slots.acquire()
+                task = asyncio.create_task(check(place))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                started += 1
+        
+        feeder = asyncio.create_task(feed())
+        getter = None
+        yielded = 0
+        try:
+            while not (feeder.done() and yielded == started):
+                getter = getter or asyncio.ensure_future(finished.get())
+                if feeder.done():
+                    feeder.result()  # Surface a failed search page
+                    await getter
+                else:
+                    # Watch the feeder too, so a search that ends or fails is noticed
+                    await asyncio.wait({getter, feeder}, return_when=asyncio.FIRST_COMPLETED)
+                    if not getter.done():
+                        continue
+                result, getter = getter.result(), None
+                yielded += 1
+                slots.release()
+                if isinstance(result, Exception):
+                    raise result
+                yield result
+            feeder.result()
+        finally:
+            # Stop outstanding lookups once the caller has enough results
+            feeder.cancel()
+            if getter is not None:
+                getter.cancel()
+            for task in list(tasks):
+                task.cancel()
+
+    async def _iter_unique_places(self, searches: List[Dict], concurrency: int):
+        """Run several nearby searches at once, yielding each place_id only once
+
+        Places are passed on page by page as each search progresses.
+        Duplicates are dropped before they reach the detail stage, so a
+        place matched by several regions or keywords is only paid for once.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        found = asyncio.Queue()
+        finished = object()  # Marks the end of one search
+        
+        async def run(search):
+            try:
+                async with semaphore:
+                    async for place in self._iter_nearby_places(
+                        max_pages=search.get('max_pages', 3), location=search['location'],
+                        radius=int(search['radius']), keyword=search.get('keyword'),
+                        type=search.get('place_type')
+                    ):
+                        await found.put(place)
+            except Exception as search_error:
+                print(f"⚠️ Search failed {search}: {str(search_error)}")
+            finally:
+                await found.put(finished)
+        
+        tasks = [asyncio.create_task(run(search)) for search in searches]
+        seen = set()
+        total = 0
+        remaining = len(tasks)
+        try:
+            while remaining:
+                place = await found.get()
+                if place is finished:
+                    remaining -= 1
+                    continue
+                total += 1
+                if place['place_id'] not in seen:
+                    seen.add(place['place_id'])
+                    yield place
+        finally:
+            for task in tasks:
+                task.cancel()
+            print(f"🔁 {len(searches)} searches returned {total} places, {len(seen)} unique: "
+                  f"{total - len(seen)} duplicate detail lookups avoided")
+
+    async def _rank_by_yield(self, places):
+        """Buffer candidate places and yield them by expected employment-review yield"""
+        candidates = [place async for place in places]
+        candidates.sort(key=self.quota_ledger.expected_yield, reverse=True)
+        for place in candidates:
+            yield place
+
+    async def _stream_reviews(self, places, max_results: Optional[int], concurrency: int,
+                              staged: bool, journal: Optional[CheckpointJournal] = None):
+        """Check a stream of places and yield each review as soon as its place is done
+
+        Stops after ``max_results`` reviews (None for no limit). ``journal``
+        is finished (deleted) when the run completes; a run stopped early
+        keeps it for a later resume.
+        """
+        yielded = 0
+        planner = RequestPlanner(self.places)
+        if self.quota_ledger.daily_budget is not None:
+            # Spend a limited budget on the most promising places first
+            places = self._rank_by_yield(places)
         
-        text = text.lower()
-        score = sum(weight for keyword, weight in keywords.items() 
-                   if keyword in text)
-        return score >= 1.0  # Lower threshold to catch more reviews
+        try:
+            async with contextlib.aclosing(
+                self._iter_place_reviews(
+                    places, concurrency,
+                    lambda place: self._check_place(place, planner, staged, journal)
+                )
+            ) as place_reviews:
+                async for found, snapshot in place_reviews:
+                    limit = None if max_results is None else max_results - yielded
+                    for review in found[:limit]:
+                        yielded += 1
+                        print(f"✨ Found employment-related review!")
+                        yield review
+                    # Only now, so a place cut short or never consumed is fetched again next run
+                    if snapshot is not None and (limit is None or len(found) <= limit):
+                        self._finish_journaled_place(snapshot, len(found), journal)
+                    if max_results is not None and yielded >= max_results:
+                        break
+            if journal is not None:
+                journal.finish()
+        except (CircuitOpenError, BudgetExhausted) as e:
+            # Keep what was collected instead of failing every remaining place
+            print(f"🛑 Stopping early: {str(e)}")
+        finally:
+            self._report_run(planner)
+
+    async def _collect_reviews(self, places, max_results: int, concurrency: int,
+                               staged: bool, journal: Optional[CheckpointJournal] = None) -> List[Dict]:
+        """Check a stream of places and gather their reviews up to ``max_results``"""
+        return [review async for review in self._stream_reviews(places, max_results, concurrency, staged, journal)]
 
-    async def get_delta_bc_reviews(self, business_type: str = None, max_results: int = 10) -> List[Dict]:
-        """Fetch employment-related reviews specifically for Delta, BC businesses"""
+    async def iter_reviews(self, business_type: str = None, regions: List[Tuple[Dict, int]] = None,
+                           keywords: List[str] = None, place_types: List[str] = None,
+                           max_results: Optional[int] = None, concurrency: int = 16,
+                           max_pages: int = 3, staged: bool = False):
+        """Yield employment-related reviews as soon as each place's details arrive
+
+        Without ``regions`` this searches Delta, BC for ``business_type`` like
+        get_delta_bc_reviews; with them, every region and keyword/type like
+        get_region_reviews. Nothing is accumulated, so memory stays flat on
+        large sweeps; break out of the loop to stop early.
+        """
+        if regions is None:
+            places = self._iter_nearby_places(
+                max_pages=max_pages,
+                location=self.location,
+                radius=self.search_radius,
+                keyword=business_type
+            )
+        else:
+            if business_type and not keywords:
+                keywords = [business_type]
+            places = self._iter_unique_places(
+                self._region_searches(regions, keywords, place_types, max_pages), concurrency)
+        
+        async with contextlib.aclosing(
+            self._stream_reviews(places, max_results, concurrency, staged)
+        ) as reviews:
+            async for review in reviews:
+                yield review
+
+    async def get_delta_bc_reviews(self, business_type: str = None, max_results: int = 10,
+                                   concurrency: int = 16, max_pages: int = 3,
+                                   staged: bool = False, resume: bool = False) -> List[Dict]:
+        """Fetch employment-related reviews specifically for Delta, BC businesses
+
+        Follows up to ``max_pages`` nearby search pages (20 places each) and
+        looks up to ``concurrency`` places at once; reviews are collected in
+        the order their places finish. ``staged`` screens places on cheap
+        fields before paying for reviews. Progress is checkpointed under
+        ``cache_dir/checkpoints``; ``resume`` continues an interrupted run
+        without repeating its finished API calls.
+        """
+        journal = CheckpointJournal(
+            os.path.join(self.config.cache_dir, 'checkpoints', f"delta_bc_{business_type or 'all'}.jsonl"),
+            resume=resume
+        )
         try:
             # Search for places in Delta, BC
-            places_result = self.client.places_nearby(
+            nearby_places = self._iter_nearby_places(
+                max_pages=max_pages,
                 location=self.location,
                 radius=self.search_radius,
                 keyword=business_type
             )
+            return await self._collect_reviews(nearby_places, max_results, concurrency, staged, journal)
             
-            if not places_result.get('results'):
-                print(f"📍 No places found matching '{business_type}' in Delta, BC")
-                return []
-            
-            print(f"📍 Found {len(places_result['results'])} places to check...")
-            
-            reviews = []
-            results_count = 0
-            
-            # Process each place
-            for place in places_result['results'][:5]:
-                if results_count >= max_results:
-                    break
-                
-                business_name = place.get('name', 'Unknown Business')
-                print(f"🏢 Checking: {business_name}")
-                
-                try:
-                    # Try text search first
-                    search_result = self.client.places(
-                        query=f"{business_name} Delta BC",
-                        location=self.location,
-                        radius=5000
-                    )
-                    
-                    if search_result.get('results'):
-                        place_id = search_result['results'][0]['place_id']
-                        
-                        # Get place details
-                        place_details = self.client.place(
-                            place_id,
-                            fields=['name', 'formatted_address', 'rating', 'reviews', 'user_ratings_total']
-                        )
-                        
-                        if place_details.get('reviews'):
-                            print(f"📝 Found {len(place_details['reviews'])} reviews")
-                            
-                            for review in place_details['reviews']:
-                                if self.filter_employment_keywords(review['text']):
-                                    reviews.append({
-                                        'business_name': place_details['name'],
-                                        'address': place_details.get('formatted_address', 'Address not available'),
-                                        'text': review['text'],
-                                        'rating': review['rating'],
-                                        'time': review['relative_time_description'],
-                                        'author': review['author_name'],
-                                        'employment_related': True
-                                    })
-                                    results_count += 1
-                                    print(f"✨ Found employment-related review!")
-                                    
-                                    if results_count >= max_results:
-                                        break
-                        else:
-                            print(f"ℹ️ No reviews available")
-                    
-                except Exception as place_error:
-                    print(f"⚠️ Error checking {business_name}: {str(place_error)}")
-                    continue
-                
-                await asyncio.sleep(2)  # Conservative rate limiting
-            
-            return reviews
+        except Exception as e:
+            print(f"❌ Error: {str(e)}")
+            return []
+        finally:
+            journal.close()
+
+    @staticmethod
+    def _region_searches(regions: List[Tuple[Dict, int]], keywords: List[str] = None,
+                         place_types: List[str] = None, max_pages: int = 3) -> List[Dict]:
+        """One nearby search per (location, radius) and keyword or place type"""
+        filters = [{'keyword': keyword} for keyword in keywords or []]
+        filters += [{'place_type': place_type} for place_type in place_types or []]
+        return [
+            dict(search_filter, location=location, radius=radius, max_pages=max_pages)
+            for location, radius in regions
+            for search_filter in filters or [{}]
+        ]
+
+    async def get_region_reviews(self, regions: List[Tuple[Dict, int]], keywords: List[str] = None,
+                                 place_types: List[str] = None, max_results: int = 100,
+                                 concurrency: int = 16, max_pages: int = 3,
+                                 staged: bool = False) -> List[Dict]:
+        """Fetch employment-related reviews across every (location, radius) and keyword/type
+
+        Every region is searched for every keyword and every place type
+        concurrently; places are deduplicated globally before any detail
+        lookup. Other arguments work as in get_delta_bc_reviews.
+        """
+        try:
+            unique_places = self._iter_unique_places(
+                self._region_searches(regions, keywords, place_types, max_pages), concurrency)
+            return await self._collect_reviews(unique_places, max_results, concurrency, staged)
             
         except Exception as e:
             print(f"❌ Error: {str(e)}")
@@ -152,27 +678,37 @@ class GoogleReviewScraper:
     async def get_reviews(self, company_name: str) -> List[Dict]:
         """Fetch and filter employment-related reviews"""
         try:
-            # Use text search for more accurate results
-            search_result = self.client.places(
-                query=company_name,
-                location=self.location,
-                radius=10000,
-                type='establishment'
-            )
+            planner = RequestPlanner(self.places)
+            place = self.place_id_cache.get(company_name, location_bias=self.location) or {}
             
-            if not search_result.get('results'):
-                print(f"📍 No places found matching: {company_name}")
-                return []
-            
-            # Get the most relevant result
-            place = search_result['results'][0]
+            if planner.plan_lookup(place):
+                # Use text search for more accurate results
+                search_result = await self.places.places(
+                    query=company_name,
+                    location=self.location,
+                    radius=10000,
+                    type='establishment'
+                )
+                
+                if not search_result.get('results'):
+                    print(f"📍 No places found matching: {company_name}")
+                    return []
+                
+                # Get the most relevant result
+                place = search_result['results'][0]
+                self.place_id_cache.put(place, company_name, location_bias=self.location)
+            self.place_id_cache.report()
             print(f"🏢 Found: {place.get('name', 'Unknown')} ({place.get('formatted_address', 'No address')})")
             
-            # Get place details with reviews
-            place_details = self.client.place(
-                place['place_id'],
-                fields=['name', 'formatted_address', 'rating', 'reviews', 'user_ratings_total']
-            )
+            # Get place details with reviews, skipping fields the search already returned
+            place_details = dict(place)
+            missing_fields = planner.plan_details(place, self.REVIEW_FIELDS)
+            if missing_fields:
+                place_details.update((await self.places.place(
+                    place['place_id'],
+                    fields=missing_fields
+                )).get('result', {}))
+            self._report_run(planner)
             
             if not place_details.get('reviews'):
                 print(f"ℹ️ No reviews available")
@@ -0,0 +1,114 @@
+import asyncio
+import threading
+from typing import Dict, Optional
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class HttpPool:
+    """Process-wide keep-alive connection pools shared by every scraper and client
+
+    One requests.Session backs all googlemaps.Client instances and one
+    aiohttp.ClientSession per event loop backs all AsyncPlacesClients, so
+    only the first call of a run pays DNS and TLS setup. warm_up() opens
+    connections ahead of time. Pool hits are requests that reused an open
+    connection; misses had to open a new one.
+    """
+
+    def __init__(self, pool_size: int = 100, keepalive_timeout: float = 30):
+        self.pool_size = pool_size
+        self.keepalive_timeout = keepalive_timeout
+        self.async_hits = 0
+        self.async_misses = 0
+        self._lock = threading.Lock()
+        self._adapter: Optional[HTTPAdapter] = None
+        self._requests_session: Optional[requests.Session] = None
+        self._aiohttp_session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def requests_session(self) -> requests.Session:
+        """Shared session for ``googlemaps.Client(requests_session=...)``"""
+        with self._lock:
+            if self._requests_session is None:
+                self._adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.pool_size)
+                session = requests.Session()
+                session.mount('https://', self._adapter)
+                session.mount('http://', self._adapter)
+                self._requests_session = session
+            return self._requests_session
+
+    async def _on_create(self, session, context, params):
+        self.async_misses += 1
+
+    async def _on_reuse(self, session, context, params):
+        self.async_hits += 1
+
+    async def aiohttp_session(self) -> aiohttp.ClientSession:
+        """Shared session for the running event loop; created on first use"""
+        loop = asyncio.get_running_loop()
+        if self._aiohttp_session is None or self._aiohttp_session.closed or self._loop is not loop:
+            trace = aiohttp.TraceConfig()
+            trace.on_connection_create_end.append(self._on_create)
+            trace.on_connection_reuseconn.append(self._on_reuse)
+            connector = aiohttp.TCPConnector(limit=self.pool_size, keepalive_timeout=self.keepalive_timeout)
+            self._aiohttp_session = aiohttp.ClientSession(connector=connector, trace_configs=[trace])
+            self._loop = loop
+        return self._aiohttp_session
+
+    async def warm_up(self, url: str, connections: int = 1):
+        """Open ``connections`` keep-alive connections to ``url``'s host before the first real call"""
+        session = await self.aiohttp_session()
+
+        async def touch():
+            try:
+                async with session.head(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                    await response.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                pass  # Warm-up is best effort; the real call will retry
+
+        await asyncio.gather(*(touch() for _ in range(connections)))
+
+    def stats(self) -> Dict[str, int]:
+        sync_requests = sync_connections = 0
+        if self._adapter is not None:
+            pools = self._adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools[key]
+                sync_requests += pool.num_requests
+                sync_connections += pool.num_connections
+        return {
+            'sync_hits': sync_requests - sync_connections,
+            'sync_misses': sync_connections,
+            'async_hits': self.async_hits,
+            'async_misses': self.async_misses,
+        }
+
+    def report(self):
+        stats = self.stats()
+        print(f"🔌 Connection pool: {stats['async_hits']} reused / {stats['async_misses']} new async connections, "
+              f"{stats['sync_hits']} reused / {stats['sync_misses']} new sync connections")
+
+    async def close(self):
+        if self._aiohttp_session is not None and not self._aiohttp_session.closed:
+            await self._aiohttp_session.close()
+        self._aiohttp_session = None
+        with self._lock:
+            if self._requests_session is not None:
+                self._requests_session.close()
+            self._requests_session = None
+            self._adapter = None
+
+
+_POOL: Optional[HttpPool] = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_http_pool(pool_size: int = 100) -> HttpPool:
+    """The process-wide pool; ``pool_size`` only applies when it is first created"""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = HttpPool(pool_size=pool_size)
+        return _POOL
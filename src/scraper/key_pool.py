@@ -0,0 +1,137 @@
+import asyncio
+import hashlib
+import random
+import time
+from typing import Dict, List, Optional
+
+from .field_masks import params_skus
+from .quota_ledger import BudgetExhausted
+from .rate_limiter import RateLimiter, rate_limiter_for
+
+_MAX_COOLDOWN = 3600  # Never rest a key for longer than this
+
+
+def key_id(key: str) -> str:
+    """Stable short id for ledgers and reports, so keys themselves are never stored"""
+    return hashlib.sha256(key.encode()).hexdigest()[:12]
+
+
+class PooledKey:
+    """One API key with its own rate limiter, daily budget and cool-down state"""
+
+    def __init__(self, key: str, rate_limiter: RateLimiter, daily_budget: Optional[float] = None):
+        self.key = key
+        self.id = key_id(key)
+        self.rate_limiter = rate_limiter
+        self.daily_budget = daily_budget
+        self.reserved = 0.0  # Cost of calls picked for this key and not yet recorded
+        self.cooldown_until = 0.0
+        self.strikes = 0
+        self.calls = 0
+        self.quota_errors = 0
+
+    @property
+    def label(self) -> str:
+        return f"{self.key[:4]}...{self.key[-4:]}"
+
+    def cooling(self, now: float) -> bool:
+        return now < self.cooldown_until
+
+
+class KeyPool:
+    """Spreads Places requests over several API keys
+
+    Each call goes to a key chosen at random, weighted by its request rate
+    times the fraction of its daily budget left, then waits on that key's
+    own rate limiter, so aggregate throughput grows with the number of
+    keys. A key that hits a quota error rests for ``cooldown`` seconds,
+    doubling on repeated errors. Per-key spend is kept in the QuotaLedger;
+    like the global budget, a call's cost is reserved on its key from
+    ``acquire`` until ``release``, so calls in flight count against it.
+    """
+
+    def __init__(self, keys: List[PooledKey], ledger=None, cooldown: float = 60.0):
+        if not keys:
+            raise ValueError("KeyPool needs at least one key")
+        self.keys = keys
+        self.ledger = ledger
+        self.cooldown = cooldown
+
+    @classmethod
+    def from_config(cls, config, ledger=None) -> 'KeyPool':
+        keys, seen = [], set()
+        specs = [(config.api_key, config.requests_per_second, None)]
+        specs += [(k.key, k.requests_per_second or config.requests_per_second, k.daily_budget)
+                  for k in config.api_keys]
+        for key, requests_per_second, daily_budget in specs:
+            if key in seen:
+                continue
+            seen.add(key)
+            limiter = rate_limiter_for(key, requests_per_second, config.burst, config.endpoint_rates)
+            keys.append(PooledKey(key, limiter, daily_budget))
+        return cls(keys, ledger=ledger, cooldown=config.key_cooldown)
+
+    def _budget_left(self, pooled: PooledKey, cost: float) -> Optional[float]:
+        """Fraction of the key's budget left after this call, None when it has no budget"""
+        if pooled.daily_budget is None or self.ledger is None:
+            return None
+        spent = self.ledger.spent(key_id=pooled.id) + pooled.reserved
+        return (pooled.daily_budget - spent - cost) / pooled.daily_budget
+
+    def _cost(self, endpoint: str, params: Dict) -> float:
+        return self.ledger.cost(params_skus(endpoint, params)) if self.ledger is not None else 0.0
+
+    async def acquire(self, endpoint: str, params: Dict) -> PooledKey:
+        """Pick a key for one call, reserve the call's cost on it and wait for its rate limiter"""
+        cost = self._cost(endpoint, params)
+        while True:
+            now = time.monotonic()
+            candidates, weights, cooling = [], [], []
+            for pooled in self.keys:
+                left = self._budget_left(pooled, cost)
+                if left is not None and left < 0:
+                    continue
+                if pooled.cooling(now):
+                    cooling.append(pooled)
+                    continue
+                candidates.append(pooled)
+                weights.append(pooled.rate_limiter.requests_per_second * (1.0 if left is None else max(left, 0.01)))
+            if candidates:
+                pooled = random.choices(candidates, weights)[0]
+                pooled.reserved += cost
+                try:
+                    await pooled.rate_limiter.acquire(endpoint)
+                except BaseException:
+                    self.release(pooled, endpoint, params)
+                    raise
+                return pooled
+            if not cooling:
+                raise BudgetExhausted("Every API key in the pool has spent its daily budget")
+            await asyncio.sleep(min(k.cooldown_until for k in cooling) - now)
+
+    def release(self, pooled: PooledKey, endpoint: str, params: Dict):
+        """The call acquire() reserved on ``pooled`` was recorded or failed"""
+        pooled.reserved = max(0.0, pooled.reserved - self._cost(endpoint, params))
+
+    def on_success(self, pooled: PooledKey, endpoint: str, params: Dict):
+        pooled.strikes = 0
+        pooled.calls += 1
+        if self.ledger is not None:
+            self.ledger.record_key(params_skus(endpoint, params), pooled.id)
+
+    def on_quota_error(self, pooled: PooledKey):
+        pooled.quota_errors += 1
+        if len(self.keys) == 1:
+            return  # Nothing to rotate to; backoff and the adaptive controller handle it
+        pooled.strikes += 1
+        rest = min(_MAX_COOLDOWN, self.cooldown * 2 ** (pooled.strikes - 1))
+        pooled.cooldown_until = time.monotonic() + rest
+        print(f"🧊 API key {pooled.label} hit its quota; resting for {rest:.0f}s")
+
+    def report(self):
+        if len(self.keys) == 1:
+            return
+        print(f"🔑 Key pool: {len(self.keys)} keys")
+        for pooled in self.keys:
+            spent = f", ${self.ledger.spent(key_id=pooled.id):.4f} today" if self.ledger is not None else ''
+            print(f"   {pooled.label}: {pooled.calls} calls, {pooled.quota_errors} quota errors{spent}")
@@ -0,0 +1,87 @@
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+
+@dataclass(frozen=True)
+class LexiconMatch:
+    """What a Lexicon found in one text"""
+    score: float  # Sum of the weights of the distinct terms found
+    matches: List[Tuple[str, int]]  # (term, start) for every occurrence, in text order
+
+
+class Lexicon:
+    """Weighted keywords compiled once into a single multi-pattern matcher
+
+    Terms are matched as case-insensitive substrings, like ``term in
+    text.lower()``, and each distinct term scores its weight once. The
+    terms are merged into a trie and emitted as one regular expression,
+    so the re engine walks every term at once in a single pass over the
+    text instead of one substring scan per term. At each position the
+    longest term wins, and the shorter terms it starts with are added
+    from a table built at compile time. That gives the same overlapping
+    matches as an Aho-Corasick automaton.
+    Positions index ``text.lower()``, which lines up with ``text`` except
+    for the few characters whose lower case is longer.
+    """
+
+    def __init__(self, weights: Dict[str, float]):
+        self.weights = {term.lower(): weight for term, weight in weights.items()}
+        if not self.weights or '' in self.weights:
+            raise ValueError("Lexicon needs at least one non-empty term")
+        self._pattern = re.compile(self._trie_pattern(self.weights))
+        # A match is the longest term at its start; it stands for every term it begins with
+        self._prefixes = {
+            term: [other for other in sorted(self.weights, key=len) if term.startswith(other)]
+            for term in self.weights
+        }
+
+    @staticmethod
+    def _trie_pattern(terms) -> str:
+        trie = {}
+        for term in terms:
+            node = trie
+            for char in term:
+                node = node.setdefault(char, {})
+            node[''] = {}  # A term ends here
+
+        def emit(node) -> str:
+            branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+            if not branches:
+                return ''
+            if '' in node:  # Greedy, so a longer term is tried before the one ending here
+                return '(?:' + '|'.join(branches) + ')?'
+            if len(branches) == 1:
+                return branches[0]
+            return '(?:' + '|'.join(branches) + ')'
+
+        return emit(trie)
+
+    def _iter_matches(self, text: str):
+        search = self._pattern.search
+        match = search(text)
+        while match:
+            start = match.start()
+            for term in self._prefixes[match.group()]:
+                yield term, start
+            match = search(text, start + 1)
+
+    def scan(self, text: str) -> LexiconMatch:
+        """Score of ``text`` and every term occurrence in it"""
+        matches = list(self._iter_matches(text.lower()))
+        score = sum(self.weights[term] for term in {term for term, _ in matches})
+        return LexiconMatch(score, matches)
+
+    def reaches(self, text: str, threshold: float) -> bool:
+        """Whether ``text`` scores at least ``threshold``, stopping as soon as it does"""
+        if threshold <= 0:
+            return True
+        score = 0
+        found = set()
+        for term, _ in self._iter_matches(text.lower()):
+            if term not in found:
+                found.add(term)
+                score += self.weights[term]
+                if score >= threshold:
+                    return True
+        return False
@@ -0,0 +1,308 @@
+"""Local stand-in for the Places web service, for offline load and scale testing.
+
+Serves findplacefromtext, nearbysearch, textsearch and details over a
+deterministic synthetic catalogue. Point GoogleAPIConfig.base_url (or the
+GOOGLE_MAPS_BASE_URL environment variable read by the scripts) at it:
+
+    python -m src.scraper.mock_places_server --places 20000 --latency 0.05 --throttle-rate 0.01
+"""
+import argparse
+import asyncio
+import base64
+import json
+import math
+import random
+import time
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional
+
+from aiohttp import web
+
+from .field_masks import result_key
+from .region_sweep import METERS_PER_DEGREE_LAT, NEARBY_MAX_RESULTS
+
+PAGE_SIZE = 20
+REVIEWS_PER_CALL = 5
+_CELL_DEGREES = 0.01  # Spatial index cell size (~1 km)
+
+_NAME_PREFIXES = ['Fraser', 'Pacific', 'Coastal', 'Golden Ears', 'Harbour', 'Delta', 'Pitt', 'Northern',
+                  'Cascade', 'Riverside', 'Summit', 'Evergreen', 'Westcoast', 'Maple', 'Airport Way']
+_NAME_CORES = ['Packaging', 'Cannabis', 'Logistics', 'Warehousing', 'Manufacturing', 'Foods', 'Farms',
+               'Metal Works', 'Plastics', 'Distribution', 'Printing', 'Coffee', 'Auto Repair', 'Bakery']
+_NAME_SUFFIXES = ['Inc.', 'Ltd.', 'Corp.', 'Co.', 'Group', 'Industries', '']
+_TYPES = {
+    'Packaging': ['storage'], 'Cannabis': ['store', 'health'], 'Logistics': ['moving_company'],
+    'Warehousing': ['storage'], 'Manufacturing': ['general_contractor'], 'Foods': ['food', 'store'],
+    'Farms': ['food'], 'Metal Works': ['general_contractor'], 'Plastics': ['general_contractor'],
+    'Distribution': ['storage'], 'Printing': ['store'], 'Coffee': ['cafe', 'food'],
+    'Auto Repair': ['car_repair'], 'Bakery': ['bakery', 'food', 'store'],
+}
+_EMPLOYEE_LINES = [
+    'I worked here for two years and management was supportive.',
+    'Toxic workplace, my supervisor never listened and the wages are low.',
+    'Great team and benefits, shifts are long but the pay is fair.',
+    'Got hired after a quick interview, training was decent.',
+    'High turnover, employees are overworked and the HR department is useless.',
+]
+_CUSTOMER_LINES = [
+    'Ordered online and the delivery was quick.',
+    'Friendly customer service and good product quality.',
+    'Bought a few items, prices are reasonable.',
+    'The store was clean and well organised.',
+    'Slow service, would not shop here again.',
+]
+_AUTHORS = ['Alex', 'Jordan', 'Sam', 'Taylor', 'Priya', 'Wei', 'Maria', 'Omar', 'Chris', 'Dana']
+
+
+def _relative_time(seconds_ago: float) -> str:
+    days = seconds_ago / 86400
+    if days < 7:
+        return 'a week ago' if days >= 1 else 'a day ago'
+    if days < 30:
+        return f'{int(days // 7)} weeks ago'
+    if days < 365:
+        months = int(days // 30)
+        return 'a month ago' if months == 1 else f'{months} months ago'
+    years = int(days // 365)
+    return 'a year ago' if years == 1 else f'{years} years ago'
+
+
+class SyntheticCatalogue:
+    """Deterministic places and reviews scattered around a center point"""
+
+    def __init__(self, places: int = 10000, seed: int = 0, center: Optional[Dict] = None,
+                 spread: float = 0.25):
+        self.seed = seed
+        self.now = 1_750_000_000  # Fixed clock so review times are reproducible
+        center = center or {'lat': 49.2163, 'lng': -122.6894}
+        rng = random.Random(seed)
+        self.places: Dict[str, Dict] = {}
+        self._cells = defaultdict(list)
+
+        for i in range(places):
+            core = rng.choice(_NAME_CORES)
+            name = ' '.join(filter(None, [rng.choice(_NAME_PREFIXES), core, rng.choice(_NAME_SUFFIXES)]))
+            lat = center['lat'] + rng.uniform(-spread, spread)
+            lng = center['lng'] + rng.uniform(-spread, spread)
+            place_id = f'mock_{seed}_{i:07d}'
+            self.places[place_id] = {
+                'place_id': place_id,
+                'name': name,
+                'formatted_address': f'{rng.randint(100, 29999)} {rng.choice(_NAME_PREFIXES)} Rd, BC',
+                'vicinity': f'{rng.choice(_NAME_PREFIXES)} Rd',
+                'geometry': {'location': {'lat': lat, 'lng': lng}},
+                'types': _TYPES[core] + ['point_of_interest', 'establishment'],
+                'business_status': 'OPERATIONAL' if rng.random() > 0.05 else 'CLOSED_PERMANENTLY',
+                'rating': round(rng.uniform(2.5, 5.0), 1),
+                'user_ratings_total': rng.choice([0, 1, 3, 8, 15, 40, 120]),
+                'url': f'https://maps.google.com/?cid={i}',
+                'prominence': rng.random(),
+            }
+            self._cells[self._cell(lat, lng)].append(place_id)
+
+    @staticmethod
+    def _cell(lat: float, lng: float):
+        return int(math.floor(lat / _CELL_DEGREES)), int(math.floor(lng / _CELL_DEGREES))
+
+    def nearby(self, lat: float, lng: float, radius: float) -> List[Dict]:
+        lat_span = radius / METERS_PER_DEGREE_LAT
+        lng_span = lat_span / max(0.01, math.cos(math.radians(lat)))
+        south, west = self._cell(lat - lat_span, lng - lng_span)
+        north, east = self._cell(lat + lat_span, lng + lng_span)
+        found = []
+        for cell_lat in range(south, north + 1):
+            for cell_lng in range(west, east + 1):
+                for place_id in self._cells.get((cell_lat, cell_lng), []):
+                    place = self.places[place_id]
+                    location = place['geometry']['location']
+                    d_lat = (location['lat'] - lat) * METERS_PER_DEGREE_LAT
+                    d_lng = (location['lng'] - lng) * METERS_PER_DEGREE_LAT * math.cos(math.radians(lat))
+                    if math.hypot(d_lat, d_lng) <= radius:
+                        found.append(place)
+        return found
+
+    def reviews(self, place_id: str, sort: str = 'most_relevant') -> List[Dict]:
+        place = self.places[place_id]
+        rng = random.Random(f'{self.seed}:{place_id}')
+        reviews = []
+        for _ in range(place['user_ratings_total']):
+            employee = rng.random() < 0.35
+            seconds_ago = rng.uniform(86400, 5 * 365 * 86400)
+            reviews.append({
+                'author_name': f'{rng.choice(_AUTHORS)} {rng.choice("ABCDEFGHJKLMNPRSTW")}.',
+                'rating': rng.randint(1, 5),
+                'text': ' '.join(rng.sample(_EMPLOYEE_LINES if employee else _CUSTOMER_LINES, 2)),
+                'time': int(self.now - seconds_ago),
+                'relative_time_description': _relative_time(seconds_ago),
+                'language': 'en',
+                'relevance': rng.random(),
+            })
+        if sort == 'newest':
+            reviews.sort(key=lambda review: review['time'], reverse=True)
+        else:
+            reviews.sort(key=lambda review: review['relevance'], reverse=True)
+        return [{k: v for k, v in review.items() if k != 'relevance'} for review in reviews[:REVIEWS_PER_CALL]]
+
+
+# What each search endpoint returns per place; details are needed for the rest
+SEARCH_FIELDS = {
+    'nearbysearch': ['business_status', 'geometry', 'name', 'place_id', 'rating', 'types',
+                     'user_ratings_total', 'vicinity'],
+    'textsearch': ['business_status', 'formatted_address', 'geometry', 'name', 'place_id', 'rating',
+                   'types', 'user_ratings_total'],
+}
+
+
+def _public(place: Dict, fields: Optional[List[str]] = None) -> Dict:
+    result = {k: v for k, v in place.items() if k != 'prominence'}
+    if fields:
+        keys = {result_key(field) for field in fields}
+        result = {k: v for k, v in result.items() if k in keys}
+    return result
+
+
+class MockPlacesServer:
+    """aiohttp app serving a SyntheticCatalogue with injectable latency, errors and throttling
+
+    ``latency`` seconds (plus up to ``jitter``) are added to every call;
+    ``error_rate`` of calls return HTTP 500 and ``throttle_rate`` return
+    OVER_QUERY_LIMIT. Page tokens only become valid ``token_delay`` seconds
+    after they are issued, like the real service. GET /stats returns call
+    counts per endpoint.
+    """
+
+    def __init__(self, catalogue: SyntheticCatalogue, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, throttle_rate: float = 0.0, token_delay: float = 0.0,
+                 seed: int = 0):
+        self.catalogue = catalogue
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.token_delay = token_delay
+        self.calls = Counter()
+        self._rng = random.Random(seed)
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get('/maps/api/place/{endpoint}/json', self.handle)
+        app.router.add_get('/stats', self.stats)
+        return app
+
+    async def stats(self, request):
+        return web.json_response(dict(self.calls))
+
+    def _page(self, results: List[Dict], page: int, query: Dict, fields=None) -> Dict:
+        body = {
+            'status': 'OK' if results else 'ZERO_RESULTS',
+            'html_attributions': [],
+            'results': [_public(place, fields) for place in results[page * PAGE_SIZE:(page + 1) * PAGE_SIZE]],
+        }
+        if (page + 1) * PAGE_SIZE < min(len(results), NEARBY_MAX_RESULTS):
+            token = {'query': query, 'page': page + 1, 'ready_at': time.time() + self.token_delay}
+            body['next_page_token'] = base64.urlsafe_b64encode(json.dumps(token).encode()).decode()
+        return body
+
+    def _search(self, endpoint: str, query: Dict) -> List[Dict]:
+        if 'location' in query:
+            lat, lng = map(float, query['location'].split(','))
+            radius = float(query.get('radius', 50000))
+            results = self.catalogue.nearby(lat, lng, radius)
+        else:
+            results = list(self.catalogue.places.values())
+
+        terms = (query.get('keyword') or query.get('query') or '').lower().split()
+        if terms:
+            results = [
+                place for place in results
+                if any(term in place['name'].lower() or term in ' '.join(place['types']) for term in terms)
+            ]
+        if query.get('type'):
+            results = [place for place in results if query['type'] in place['types']]
+        results.sort(key=lambda place: place['prominence'], reverse=True)
+        return results[:NEARBY_MAX_RESULTS]
+
+    async def handle(self, request):
+        endpoint = request.match_info['endpoint']
+        query = dict(request.query)
+        self.calls[endpoint] += 1
+
+        delay = self.latency + self._rng.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        if self._rng.random() < self.error_rate:
+            self.calls['http_500'] += 1
+            return web.Response(status=500, text='Injected server error')
+        if self._rng.random() < self.throttle_rate:
+            self.calls['over_query_limit'] += 1
+            return web.json_response({'status': 'OVER_QUERY_LIMIT', 'error_message': 'Injected throttle'})
+        if not query.pop('key', None):
+            return web.json_response({'status': 'REQUEST_DENIED', 'error_message': 'Missing key'})
+
+        if endpoint == 'details':
+            place = self.catalogue.places.get(query.get('placeid') or query.get('place_id', ''))
+            if place is None:
+                return web.json_response({'status': 'NOT_FOUND', 'html_attributions': []})
+            fields = query['fields'].split(',') if query.get('fields') else None
+            result = dict(place)
+            if fields is None or 'reviews' in {result_key(field) for field in fields}:
+                result['reviews'] = self.catalogue.reviews(place['place_id'], query.get('reviews_sort', 'most_relevant'))
+            return web.json_response({'status': 'OK', 'html_attributions': [], 'result': _public(result, fields)})
+
+        if endpoint == 'findplacefromtext':
+            query['query'] = query.get('input', '')
+            results = self._search(endpoint, query)[:1]
+            fields = query['fields'].split(',') if query.get('fields') else ['place_id']
+            return web.json_response({
+                'status': 'OK' if results else 'ZERO_RESULTS',
+                'candidates': [_public(place, fields) for place in results],
+            })
+
+        if endpoint in ('nearbysearch', 'textsearch'):
+            if 'pagetoken' in query:
+                try:
+                    token = json.loads(base64.urlsafe_b64decode(query['pagetoken'].encode()))
+                except ValueError:
+                    return web.json_response({'status': 'INVALID_REQUEST'})
+                if time.time() < token['ready_at']:
+                    return web.json_response({'status': 'INVALID_REQUEST'})
+                return web.json_response(self._page(self._search(endpoint, token['query']),
+                                                    token['page'], token['query'], SEARCH_FIELDS[endpoint]))
+            return web.json_response(self._page(self._search(endpoint, query), 0, query, SEARCH_FIELDS[endpoint]))
+
+        return web.json_response({'status': 'INVALID_REQUEST', 'error_message': f'Unknown endpoint {endpoint}'})
+
+
+async def start_mock_server(server: MockPlacesServer, host: str = '127.0.0.1', port: int = 8765) -> web.AppRunner:
+    """Start serving in the running loop; call ``await runner.cleanup()`` to stop"""
+    runner = web.AppRunner(server.app())
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    return runner
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run a local mock Places API server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--places', type=int, default=10000, help='Synthetic places to generate')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every call')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Extra random latency, up to this many seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of calls answered with HTTP 500')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='Fraction answered OVER_QUERY_LIMIT')
+    parser.add_argument('--token-delay', type=float, default=2.0, help='Seconds before a page token is valid')
+    args = parser.parse_args()
+
+    print(f"🏗️ Generating {args.places} synthetic places...")
+    server = MockPlacesServer(
+        SyntheticCatalogue(places=args.places, seed=args.seed),
+        latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate, token_delay=args.token_delay, seed=args.seed
+    )
+    print(f"🚀 Mock Places API on http://{args.host}:{args.port} (stats at /stats)")
+    web.run_app(server.app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
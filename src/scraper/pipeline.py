@@ -0,0 +1,121 @@
+import asyncio
+import time
+from typing import Any, Callable, List, Optional
+
+_DONE = object()  # Tells a worker its input is exhausted
+
+
+class Stage:
+    """One step of a Pipeline, run by ``concurrency`` workers reading a bounded input queue
+
+    ``func`` takes one item and returns the item to pass on, or None to
+    drop it; coroutine functions are awaited and plain functions called
+    inline. With ``expand`` the result is an iterable of items.
+    """
+
+    def __init__(self, name: str, func: Callable[[Any], Any], concurrency: int = 1,
+                 queue_size: int = 100, expand: bool = False):
+        self.name = name
+        self.func = func
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.expand = expand
+        self.items_in = 0
+        self.items_out = 0
+        self.dropped = 0
+        self.busy = 0.0
+        self.max_depth = 0
+        self._depth_total = 0
+
+    def _observe(self, depth: int):
+        self.max_depth = max(self.max_depth, depth)
+        self._depth_total += depth
+
+    def mean_depth(self) -> float:
+        return self._depth_total / self.items_in if self.items_in else 0.0
+
+
+class Pipeline:
+    """Runs items from a source through Stages connected by bounded asyncio.Queues
+
+    Each stage has its own worker pool, so stages overlap; a full queue
+    blocks the stage feeding it (backpressure), which keeps memory bounded
+    by the queue sizes and lets the slowest stage set the pace. The first
+    worker error cancels the whole pipeline and is raised from run().
+    """
+
+    def __init__(self, stages: List[Stage]):
+        if not stages:
+            raise ValueError("Pipeline needs at least one stage")
+        self.stages = stages
+        self.elapsed = 0.0
+
+    async def run(self, source):
+        """Feed ``source`` (an iterable or async iterable) through every stage"""
+        queues = [asyncio.Queue(maxsize=stage.queue_size) for stage in self.stages]
+        queues.append(None)  # The last stage's output is discarded
+        remaining = [stage.concurrency for stage in self.stages]
+        sentinels = [0] * len(self.stages)  # _DONE markers queued but not yet read, per queue
+
+        async def finish(index: int):
+            for _ in range(self.stages[index].concurrency):
+                sentinels[index] += 1
+                await queues[index].put(_DONE)
+
+        async def feed():
+            if hasattr(source, '__aiter__'):
+                async for item in source:
+                    await queues[0].put(item)
+            else:
+                for item in source:
+                    await queues[0].put(item)
+            await finish(0)
+
+        async def emit(index: int, item):
+            if queues[index + 1] is not None:
+                await queues[index + 1].put(item)
+            self.stages[index].items_out += 1
+
+        async def work(index: int):
+            stage, inbox = self.stages[index], queues[index]
+            while True:
+                item = await inbox.get()
+                if item is _DONE:
+                    sentinels[index] -= 1
+                    remaining[index] -= 1
+                    if remaining[index] == 0 and queues[index + 1] is not None:
+                        await finish(index + 1)
+                    return
+                stage.items_in += 1
+                stage._observe(max(0, inbox.qsize() - sentinels[index]))
+                started = time.monotonic()
+                result = stage.func(item)
+                if asyncio.iscoroutine(result):
+                    result = await result
+                stage.busy += time.monotonic() - started
+                if result is None:
+                    stage.dropped += 1
+                elif stage.expand:
+                    for each in result:
+                        await emit(index, each)
+                else:
+                    await emit(index, result)
+
+        started = time.monotonic()
+        tasks = [asyncio.create_task(feed())]
+        tasks += [asyncio.create_task(work(index))
+                  for index, stage in enumerate(self.stages) for _ in range(stage.concurrency)]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            self.elapsed = time.monotonic() - started
+
+    def report(self, title: Optional[str] = None):
+        print(f"🏭 {title or 'Pipeline'}: {self.elapsed:.2f}s")
+        for stage in self.stages:
+            rate = stage.items_in / self.elapsed if self.elapsed else 0.0
+            print(f"   {stage.name} x{stage.concurrency}: {stage.items_in} in, {stage.items_out} out, "
+                  f"{stage.dropped} dropped, {rate:.1f} items/s, busy {stage.busy:.2f}s, "
+                  f"queue depth mean {stage.mean_depth():.1f} / max {stage.max_depth} of {stage.queue_size}")
@@ -0,0 +1,69 @@
+import json
+import os
+import re
+import time
+from typing import Dict, Optional, Union
+
+
+class PlaceIdCache:
+    """On-disk map of normalized (name, address, location bias) to a resolved place
+
+    Google allows place_ids to be stored indefinitely, so lookups that
+    resolve a company to a place only need to happen once. Entries older
+    than ``max_age`` seconds are treated as misses so they get refreshed.
+    """
+
+    def __init__(self, path: str = '.cache/place_ids.json', max_age: Optional[float] = None):
+        self.path = path
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, Dict] = {}
+        if os.path.isfile(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Warning: Ignoring unreadable place_id cache: {str(e)}")
+
+    @staticmethod
+    def make_key(name: str, address: Optional[str] = None,
+                 location_bias: Optional[Union[str, Dict]] = None) -> str:
+        def normalize(text):
+            return ' '.join(re.sub(r'[^\w\s]', ' ', text.lower()).split())
+
+        if isinstance(location_bias, dict):
+            location_bias = f"{location_bias['lat']:.4f},{location_bias['lng']:.4f}"
+        return '|'.join([normalize(name), normalize(address or ''), location_bias or ''])
+
+    def get(self, name: str, address: Optional[str] = None,
+            location_bias: Optional[Union[str, Dict]] = None) -> Optional[Dict]:
+        """Cached place (place_id, name, formatted_address) or None"""
+        entry = self._entries.get(self.make_key(name, address, location_bias))
+        if entry and (self.max_age is None or time.time() - entry['cached_at'] <= self.max_age):
+            self.hits += 1
+            return {k: v for k, v in entry.items() if k != 'cached_at'}
+        self.misses += 1
+        return None
+
+    def put(self, place: Dict, name: str, address: Optional[str] = None,
+            location_bias: Optional[Union[str, Dict]] = None):
+        self._entries[self.make_key(name, address, location_bias)] = {
+            'place_id': place['place_id'],
+            'name': place.get('name'),
+            'formatted_address': place.get('formatted_address'),
+            'cached_at': time.time()
+        }
+        self._save()
+
+    def _save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._entries, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def report(self):
+        print(f"🗂️ place_id cache: {self.hits} hits, {self.misses} misses")
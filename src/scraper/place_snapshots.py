@@ -0,0 +1,114 @@
+import os
+import sqlite3
+import time
+from typing import Dict, List, Optional
+
+
+class PlaceSnapshots:
+    """SQLite store of each place's ``user_ratings_total`` and ``rating`` at its last reviews fetch
+
+    A place's reviews can only have changed if its rating count moved, so a
+    search result whose count matches the snapshot needs no reviews call.
+
+    It also keeps a per-place watermark, the epoch ``time`` and author of
+    the newest review already processed, so newest-first review lists can
+    be cut at the first review an earlier run has seen.
+    """
+
+    def __init__(self, path: str = '.cache/place_snapshots.sqlite'):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.unchanged = 0
+        self.changed = 0
+        self.new = 0
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('''
+            CREATE TABLE IF NOT EXISTS snapshots (
+                place_id TEXT PRIMARY KEY,
+                user_ratings_total INTEGER,
+                rating REAL,
+                fetched_at REAL NOT NULL
+            )
+        ''')
+        self._db.execute('''
+            CREATE TABLE IF NOT EXISTS watermarks (
+                place_id TEXT PRIMARY KEY,
+                newest_time INTEGER NOT NULL,
+                newest_author TEXT NOT NULL
+            )
+        ''')
+        self._db.commit()
+
+    def close(self):
+        self._db.close()
+
+    def get(self, place_id: str) -> Optional[Dict]:
+        row = self._db.execute(
+            'SELECT user_ratings_total, rating, fetched_at FROM snapshots WHERE place_id = ?', (place_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return {'user_ratings_total': row[0], 'rating': row[1], 'fetched_at': row[2]}
+
+    def is_unchanged(self, place: Dict) -> bool:
+        """True when the place's current rating count matches its snapshot; unknown counts are changed"""
+        if place.get('user_ratings_total') is None:
+            return False
+        snapshot = self.get(place['place_id'])
+        if snapshot is None:
+            self.new += 1
+            return False
+        if snapshot['user_ratings_total'] == place['user_ratings_total']:
+            self.unchanged += 1
+            return True
+        self.changed += 1
+        return False
+
+    def put(self, place_id: str, user_ratings_total: Optional[int], rating: Optional[float]):
+        with self._db:
+            self._db.execute(
+                'INSERT OR REPLACE INTO snapshots (place_id, user_ratings_total, rating, fetched_at) '
+                'VALUES (?, ?, ?, ?)',
+                (place_id, user_ratings_total, rating, time.time())
+            )
+
+    def watermark(self, place_id: str) -> Optional[Dict]:
+        row = self._db.execute(
+            'SELECT newest_time, newest_author FROM watermarks WHERE place_id = ?', (place_id,)
+        ).fetchone()
+        return {'time': row[0], 'author_name': row[1]} if row else None
+
+    def new_reviews(self, place_id: str, reviews: List[Dict]) -> List[Dict]:
+        """Reviews (sorted newest first) up to the first one at or behind the watermark"""
+        mark = self.watermark(place_id)
+        if mark is None:
+            return list(reviews)
+        fresh = []
+        for review in reviews:
+            review_time = review.get('time', 0)
+            if review_time < mark['time'] or (
+                    review_time == mark['time'] and review.get('author_name', '') == mark['author_name']):
+                break
+            fresh.append(review)
+        return fresh
+
+    def advance_watermark(self, place_id: str, reviews: List[Dict]):
+        """Move the watermark to the newest of ``reviews`` once they have been processed"""
+        if not reviews:
+            return
+        newest = max(reviews, key=lambda review: review.get('time', 0))
+        mark = self.watermark(place_id)
+        if mark is not None and newest.get('time', 0) < mark['time']:
+            return
+        with self._db:
+            self._db.execute(
+                'INSERT OR REPLACE INTO watermarks (place_id, newest_time, newest_author) VALUES (?, ?, ?)',
+                (place_id, newest.get('time', 0), newest.get('author_name', ''))
+            )
+
+    def report(self):
+        print(f"🔁 Change detection: {self.unchanged} unchanged places skipped, "
+              f"{self.changed} changed, {self.new} new")
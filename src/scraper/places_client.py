@@ -0,0 +1,204 @@
+import asyncio
+import json
+import time
+from collections import Counter
+from typing import Dict, Optional
+
+import aiohttp
+import googlemaps
+from googlemaps import places as gmaps_places
+from googlemaps.client import urlencode_params
+from yarl import URL
+
+from .adaptive import AdaptiveController, backoff_delay, is_quota_error, is_retriable
+from .single_flight import SingleFlight
+
+_DEFAULT_BASE_URL = "https://maps.googleapis.com"
+
+
+class _RequestBuilder:
+    """Stand-in for googlemaps.Client that captures the request instead of sending it.
+
+    Passing this to the functions in googlemaps.places gives us their exact
+    parameter encoding and field validation without a blocking round trip.
+    """
+
+    def _request(self, url, params):
+        return url, params
+
+
+_BUILDER = _RequestBuilder()
+
+
+def endpoint_name(url: str) -> str:
+    """'/maps/api/place/details/json' -> 'details'"""
+    return url.rstrip('/').split('/')[-2]
+
+
+class AsyncPlacesClient:
+    """Non-blocking Places API client with pooled keep-alive connections.
+
+    Mirrors the Places methods of googlemaps.Client and returns the same
+    response bodies, so callers only need to ``await`` the call. With an
+    ``http_pool`` the connections are shared with every other client in
+    the process; otherwise the client owns a session of ``pool_size``.
+    """
+
+    def __init__(self, key: str, base_url: str = _DEFAULT_BASE_URL,
+                 timeout: float = 30, pool_size: int = 100,
+                 max_retries: int = 5, response_cache=None,
+                 cost_tracker=None, single_flight: Optional[SingleFlight] = None,
+                 controller: Optional[AdaptiveController] = None, cassette=None,
+                 http_pool=None, key_pool=None):
+        self.key = key
+        self.key_pool = key_pool
+        self.http_pool = http_pool
+        self.cassette = cassette
+        self.controller = controller or AdaptiveController()
+        self.single_flight = single_flight or SingleFlight()
+        self.cost_tracker = cost_tracker
+        self.response_cache = response_cache
+        self.base_url = base_url.rstrip('/')
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.sent = Counter()  # Requests put on the wire, per endpoint, retries included
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self.http_pool is not None:
+            return await self.http_pool.aiohttp_session()
+        # The session must be created inside a running event loop
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_size, keepalive_timeout=30)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close(self):
+        self.single_flight.cancel_all()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def _get_body(self, status_code: int, body: Dict) -> Dict:
+        """Same status handling as googlemaps.Client._get_body"""
+        if status_code != 200:
+            raise googlemaps.exceptions.HTTPError(status_code)
+
+        api_status = body["status"]
+        if api_status == "OK" or api_status == "ZERO_RESULTS":
+            return body
+
+        if api_status == "OVER_QUERY_LIMIT":
+            raise googlemaps.exceptions._OverQueryLimit(
+                api_status, body.get("error_message"))
+
+        raise googlemaps.exceptions.ApiError(api_status, body.get("error_message"))
+
+    async def _request(self, url: str, params: Dict) -> Dict:
+        """Share one in-flight call between concurrent identical requests"""
+        flight_key = (url, json.dumps(sorted(params.items()), default=str))
+        return await self.single_flight.do(flight_key, lambda: self._fetch(url, params))
+
+    async def _fetch(self, url: str, params: Dict) -> Dict:
+        """Serve a request from the response cache when one is attached, else send it"""
+        if self.response_cache is not None:
+            return await self.response_cache.fetch(
+                endpoint_name(url), params, lambda send_params: self._send(url, send_params))
+        return await self._send(url, params)
+
+    async def _get(self, session: aiohttp.ClientSession, request_url: URL) -> Dict:
+        if self.cassette is not None and self.cassette.replaying:
+            status_code, text = await self.cassette.replay_async(str(request_url))
+        else:
+            started = time.monotonic()
+            try:
+                async with session.get(request_url, timeout=self.timeout) as response:
+                    status_code = response.status
+                    text = await response.text()
+            except asyncio.TimeoutError:
+                raise googlemaps.exceptions.Timeout()
+            except aiohttp.ClientError as e:
+                raise googlemaps.exceptions.TransportError(e)
+            if self.cassette is not None:
+                self.cassette.record(str(request_url), status_code, text, time.monotonic() - started)
+        body = json.loads(text) if status_code == 200 else None
+        return self._get_body(status_code, body)
+
+    async def _send(self, url: str, params: Dict) -> Dict:
+        """Perform a GET against the Places API under the adaptive controller
+
+        Throttling, server and network errors are retried up to
+        ``max_retries`` times with jittered exponential backoff. With a
+        ``key_pool`` every attempt may go out under a different key.
+        """
+        session = await self._get_session()
+        endpoint = endpoint_name(url)
+
+        # Reserve the call's cost, so calls in flight count against the budget
+        reserved = self.cost_tracker.check(endpoint, params) if self.cost_tracker is not None else 0.0
+        try:
+            for attempt in range(self.max_retries + 1):
+                if attempt > 0:
+                    self.controller.retries += 1
+                    await asyncio.sleep(backoff_delay(attempt - 1))
+
+                pooled = None
+                key = self.key
+                if self.key_pool is not None:
+                    # Reserves the call against the key's own budget until it is recorded or fails
+                    pooled = await self.key_pool.acquire(endpoint, params)
+                    key = pooled.key
+                try:
+                    # Encode exactly like googlemaps.Client and stop aiohttp re-quoting it
+                    query = urlencode_params(sorted(params.items()) + [("key", key)])
+                    request_url = URL(f"{self.base_url}{url}?{query}", encoded=True)
+
+                    await self.controller.acquire()
+                    started = time.monotonic()
+                    self.sent[endpoint] += 1
+                    try:
+                        body = await self._get(session, request_url)
+                    except Exception as e:
+                        if pooled is not None and is_quota_error(e):
+                            self.key_pool.on_quota_error(pooled)
+                        if not is_retriable(e):
+                            raise
+                        self.controller.on_failure()
+                        last_error = e
+                        continue
+                    finally:
+                        await self.controller.release()
+
+                    self.controller.on_success(time.monotonic() - started)
+                    if pooled is not None:
+                        self.key_pool.on_success(pooled, endpoint, params)
+                    if self.cost_tracker is not None:
+                        self.cost_tracker.record(endpoint, params)
+                    return body
+                finally:
+                    if pooled is not None:
+                        self.key_pool.release(pooled, endpoint, params)
+
+            raise last_error
+        finally:
+            if self.cost_tracker is not None:
+                self.cost_tracker.release(reserved)
+
+    async def find_place(self, input, input_type, **kwargs) -> Dict:
+        return await self._request(*gmaps_places.find_place(_BUILDER, input, input_type, **kwargs))
+
+    async def places(self, query=None, **kwargs) -> Dict:
+        return await self._request(*gmaps_places.places(_BUILDER, query=query, **kwargs))
+
+    async def places_nearby(self, location=None, **kwargs) -> Dict:
+        return await self._request(*gmaps_places.places_nearby(_BUILDER, location=location, **kwargs))
+
+    async def place(self, place_id, **kwargs) -> Dict:
+        return await self._request(*gmaps_places.place(_BUILDER, place_id, **kwargs))
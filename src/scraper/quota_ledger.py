@@ -0,0 +1,174 @@
+import os
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional
+
+from .field_masks import SKU_PRICES_PER_1000
+
+try:
+    from zoneinfo import ZoneInfo
+    _QUOTA_TZ = ZoneInfo('America/Los_Angeles')
+except Exception:  # No tz database on this machine; ignore daylight saving
+    _QUOTA_TZ = timezone(timedelta(hours=-8))
+
+# Name/type hints that a place employs people on site (manufacturing, cannabis, logistics...)
+_EMPLOYER_HINTS = [
+    'manufactur', 'industr', 'cannabis', 'farm', 'logistic', 'warehouse', 'distribution',
+    'storage', 'factory', 'production', 'processing', 'inc', 'ltd', 'corp', 'packaging'
+]
+
+
+class BudgetExhausted(Exception):
+    """Raised before a call that would exceed the daily quota budget"""
+
+
+def quota_day(now: Optional[datetime] = None) -> str:
+    """Google resets Places quotas at midnight Pacific Time"""
+    return (now or datetime.now(timezone.utc)).astimezone(_QUOTA_TZ).date().isoformat()
+
+
+class QuotaLedger:
+    """SQLite ledger of billed Places calls per SKU and quota day, shared across runs and processes
+
+    With a ``daily_budget`` (USD at SKU_PRICES_PER_1000) set, check() raises
+    BudgetExhausted before a call that would overspend today's budget, and
+    otherwise reserves the call's cost until release(), so calls already in
+    flight count against the budget too. The ledger also keeps, per place,
+    how many detail lookups were made and how many employment reviews they
+    produced, to rank places by expected yield.
+    """
+
+    def __init__(self, path: str = '.cache/quota_ledger.sqlite', daily_budget: Optional[float] = None,
+                 prices: Optional[Dict[str, float]] = None):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.daily_budget = daily_budget
+        self.prices = prices or SKU_PRICES_PER_1000
+        self.reserved = 0.0  # Cost of checked calls still in flight in this process
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.executescript('''
+            CREATE TABLE IF NOT EXISTS calls (
+                quota_day TEXT NOT NULL,
+                sku TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                PRIMARY KEY (quota_day, sku)
+            );
+            CREATE TABLE IF NOT EXISTS key_calls (
+                quota_day TEXT NOT NULL,
+                key_id TEXT NOT NULL,
+                sku TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                PRIMARY KEY (quota_day, key_id, sku)
+            );
+            CREATE TABLE IF NOT EXISTS place_yield (
+                place_id TEXT PRIMARY KEY,
+                lookups INTEGER NOT NULL,
+                employment_reviews INTEGER NOT NULL
+            );
+        ''')
+        self._db.commit()
+
+    def close(self):
+        self._db.close()
+
+    def cost(self, skus: Iterable[str]) -> float:
+        return sum(self.prices.get(sku, 0.0) / 1000 for sku in skus)
+
+    def record(self, skus: Iterable[str]):
+        day = quota_day()
+        with self._db:
+            for sku in skus:
+                self._db.execute(
+                    'INSERT INTO calls (quota_day, sku, count) VALUES (?, ?, 1) '
+                    'ON CONFLICT (quota_day, sku) DO UPDATE SET count = count + 1',
+                    (day, sku)
+                )
+
+    def record_key(self, skus: Iterable[str], key_id: str):
+        """Attribute billed SKUs to one API key of a KeyPool"""
+        day = quota_day()
+        with self._db:
+            for sku in skus:
+                self._db.execute(
+                    'INSERT INTO key_calls (quota_day, key_id, sku, count) VALUES (?, ?, ?, 1) '
+                    'ON CONFLICT (quota_day, key_id, sku) DO UPDATE SET count = count + 1',
+                    (day, key_id, sku)
+                )
+
+    def usage(self, day: Optional[str] = None, key_id: Optional[str] = None) -> Dict[str, int]:
+        if key_id is None:
+            rows = self._db.execute(
+                'SELECT sku, count FROM calls WHERE quota_day = ?', (day or quota_day(),)
+            ).fetchall()
+        else:
+            rows = self._db.execute(
+                'SELECT sku, count FROM key_calls WHERE quota_day = ? AND key_id = ?',
+                (day or quota_day(), key_id)
+            ).fetchall()
+        return dict(rows)
+
+    def spent(self, day: Optional[str] = None, key_id: Optional[str] = None) -> float:
+        return sum(count * self.prices.get(sku, 0.0) / 1000 for sku, count in self.usage(day, key_id).items())
+
+    def remaining(self) -> Optional[float]:
+        if self.daily_budget is None:
+            return None
+        return max(0.0, self.daily_budget - self.spent())
+
+    def check(self, skus: List[str]) -> float:
+        """Reserve the cost of a call about to be sent; returns the amount for release()"""
+        remaining = self.remaining()
+        if remaining is None:
+            return 0.0
+        cost = self.cost(skus)
+        if cost > remaining - self.reserved:
+            raise BudgetExhausted(
+                f"Daily Places budget of ${self.daily_budget:.2f} spent for quota day {quota_day()}")
+        self.reserved += cost
+        return cost
+
+    def release(self, reserved: float):
+        """The call reserved by check() was recorded or failed"""
+        self.reserved = max(0.0, self.reserved - reserved)
+
+    def record_yield(self, place_id: str, employment_reviews: int):
+        with self._db:
+            self._db.execute(
+                'INSERT INTO place_yield (place_id, lookups, employment_reviews) VALUES (?, 1, ?) '
+                'ON CONFLICT (place_id) DO UPDATE SET lookups = lookups + 1, '
+                'employment_reviews = employment_reviews + excluded.employment_reviews',
+                (place_id, employment_reviews)
+            )
+
+    def expected_yield(self, place: Dict) -> float:
+        """Expected employment reviews from one details call (at most 5 reviews come back)
+
+        Starts from a prior based on review count and employer-like
+        name/types and moves toward the observed history of the place.
+        """
+        text = ' '.join([place.get('name', '')] + place.get('types', [])).lower()
+        employer_rate = 0.6 if any(hint in text for hint in _EMPLOYER_HINTS) else 0.3
+        prior = employer_rate * min(5, place.get('user_ratings_total', 5))
+
+        row = self._db.execute(
+            'SELECT lookups, employment_reviews FROM place_yield WHERE place_id = ?',
+            (place.get('place_id'),)
+        ).fetchone()
+        if row is None:
+            return prior
+        lookups, employment_reviews = row
+        return (employment_reviews + prior) / (lookups + 1)
+
+    def report(self, days: int = 1):
+        today = datetime.now(timezone.utc)
+        for offset in range(days):
+            day = quota_day(today - timedelta(days=offset))
+            usage = self.usage(day)
+            print(f"📒 Quota day {day}: ${self.spent(day):.4f} across {sum(usage.values())} billed SKU events")
+            for sku, count in sorted(usage.items()):
+                print(f"   {sku}: {count}")
+        if self.daily_budget is not None:
+            print(f"   Budget: ${self.daily_budget:.2f}, remaining today ${self.remaining():.4f}")
@@ -0,0 +1,72 @@
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+
+
+class TokenBucket:
+    """Async token bucket refilled at ``rate`` tokens/s, holding at most ``capacity``.
+
+    Callers reserve tokens up front and sleep off any debt, so waiters are
+    served in arrival order and no lock is held across an ``await``.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float) -> float:
+        """Take tokens now and return how long the caller must wait for them"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    async def acquire(self, tokens: float = 1) -> float:
+        delay = self._reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+class RateLimiter:
+    """Separate token buckets per Places endpoint (each endpoint is its own SKU)"""
+
+    def __init__(self, requests_per_second: float, burst: Optional[int] = None,
+                 endpoint_rates: Optional[Dict[str, float]] = None):
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.endpoint_rates = dict(endpoint_rates or {})
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, endpoint: str) -> TokenBucket:
+        with self._lock:
+            if endpoint not in self._buckets:
+                rate = self.endpoint_rates.get(endpoint, self.requests_per_second)
+                self._buckets[endpoint] = TokenBucket(rate, self.burst)
+            return self._buckets[endpoint]
+
+    async def acquire(self, endpoint: str) -> float:
+        return await self.bucket(endpoint).acquire()
+
+
+_LIMITERS: Dict[str, RateLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def rate_limiter_for(api_key: str, requests_per_second: float, burst: Optional[int] = None,
+                     endpoint_rates: Optional[Dict[str, float]] = None) -> RateLimiter:
+    """Process-wide limiter for one API key; the first caller for a key sets its rates"""
+    with _LIMITERS_LOCK:
+        if api_key not in _LIMITERS:
+            _LIMITERS[api_key] = RateLimiter(requests_per_second, burst, endpoint_rates)
+        return _LIMITERS[api_key]
+
@@ -0,0 +1,138 @@
+import asyncio
+import math
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+METERS_PER_DEGREE_LAT = 111320
+NEARBY_MAX_RADIUS = 50000  # Largest radius Nearby Search accepts
+NEARBY_MAX_RESULTS = 60  # 3 pages of 20; a tile returning this many may be truncated
+
+LatLng = Tuple[float, float]
+
+
+def point_in_polygon(lat: float, lng: float, polygon: Sequence[LatLng]) -> bool:
+    """Ray-casting test; polygon is a list of (lat, lng) vertices"""
+    inside = False
+    j = len(polygon) - 1
+    for i in range(len(polygon)):
+        lat_i, lng_i = polygon[i]
+        lat_j, lng_j = polygon[j]
+        if (lng_i > lng) != (lng_j > lng) and \
+                lat < (lat_j - lat_i) * (lng - lng_i) / (lng_j - lng_i) + lat_i:
+            inside = not inside
+        j = i
+    return inside
+
+
+@dataclass(frozen=True)
+class BoundingBox:
+    south: float
+    west: float
+    north: float
+    east: float
+
+    @classmethod
+    def around(cls, polygon: Sequence[LatLng]) -> 'BoundingBox':
+        lats = [lat for lat, _ in polygon]
+        lngs = [lng for _, lng in polygon]
+        return cls(min(lats), min(lngs), max(lats), max(lngs))
+
+    @property
+    def center(self) -> Dict[str, float]:
+        return {'lat': (self.south + self.north) / 2, 'lng': (self.west + self.east) / 2}
+
+    @property
+    def radius(self) -> float:
+        """Meters from the center to a corner, so the search circle covers the whole tile"""
+        lat_m = (self.north - self.south) / 2 * METERS_PER_DEGREE_LAT
+        lng_m = (self.east - self.west) / 2 * METERS_PER_DEGREE_LAT * math.cos(math.radians(self.center['lat']))
+        return math.hypot(lat_m, lng_m)
+
+    def contains(self, lat: float, lng: float) -> bool:
+        return self.south <= lat <= self.north and self.west <= lng <= self.east
+
+    def corners(self) -> List[LatLng]:
+        return [(self.south, self.west), (self.south, self.east),
+                (self.north, self.east), (self.north, self.west)]
+
+    def intersects(self, polygon: Sequence[LatLng]) -> bool:
+        return (
+            any(point_in_polygon(lat, lng, polygon) for lat, lng in self.corners())
+            or any(self.contains(lat, lng) for lat, lng in polygon)
+            or point_in_polygon(self.center['lat'], self.center['lng'], polygon)
+        )
+
+    def split(self) -> List['BoundingBox']:
+        mid_lat = (self.south + self.north) / 2
+        mid_lng = (self.west + self.east) / 2
+        return [
+            BoundingBox(self.south, self.west, mid_lat, mid_lng),
+            BoundingBox(self.south, mid_lng, mid_lat, self.east),
+            BoundingBox(mid_lat, self.west, self.north, mid_lng),
+            BoundingBox(mid_lat, mid_lng, self.north, self.east),
+        ]
+
+
+class RegionSweeper:
+    """Adaptive quadtree sweep of an area with Nearby Search
+
+    Tiles whose search comes back saturated (60 results) are split into
+    quarters until they fit or reach ``min_radius`` meters. Places are
+    deduplicated across overlapping tiles by place_id and tiles are searched
+    up to ``concurrency`` at a time. ``search(location, radius)`` must
+    return every result for one circle.
+    """
+
+    def __init__(self, search: Callable[[Dict, float], Awaitable[List[Dict]]],
+                 concurrency: int = 8, min_radius: float = 250):
+        self.search = search
+        self.concurrency = concurrency
+        self.min_radius = min_radius
+        self.tiles_searched = 0
+        self.tiles_split = 0
+        self.duplicates = 0
+
+    async def sweep(self, area: Union[BoundingBox, Sequence[LatLng]]) -> List[Dict]:
+        polygon: Optional[Sequence[LatLng]] = None
+        if not isinstance(area, BoundingBox):
+            polygon = area
+            area = BoundingBox.around(polygon)
+
+        def in_area(place):
+            location = place.get('geometry', {}).get('location')
+            if not location:
+                return True
+            if polygon is not None:
+                return point_in_polygon(location['lat'], location['lng'], polygon)
+            return area.contains(location['lat'], location['lng'])
+
+        places: Dict[str, Dict] = {}
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def visit(tile: BoundingBox):
+            if polygon is not None and not tile.intersects(polygon):
+                return
+            async with semaphore:
+                results = await self.search(tile.center, min(tile.radius, NEARBY_MAX_RADIUS))
+            self.tiles_searched += 1
+
+            for place in results:
+                if place['place_id'] in places:
+                    self.duplicates += 1
+                elif in_area(place):
+                    places[place['place_id']] = place
+
+            if len(results) >= NEARBY_MAX_RESULTS and tile.radius / 2 >= self.min_radius:
+                self.tiles_split += 1
+                await asyncio.gather(*(visit(child) for child in tile.split()))
+
+        # An area wider than one search circle starts out pre-split
+        tiles = [area]
+        while tiles[0].radius > NEARBY_MAX_RADIUS:
+            tiles = [child for tile in tiles for child in tile.split()]
+        await asyncio.gather(*(visit(tile) for tile in tiles))
+        return list(places.values())
+
+    def report(self):
+        print(f"🗺️ Region sweep: {self.tiles_searched} tiles searched, {self.tiles_split} split, "
+              f"{self.duplicates} duplicate results dropped")
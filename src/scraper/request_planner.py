@@ -0,0 +1,62 @@
+from collections import Counter
+from typing import Dict, List
+
+from .field_masks import result_key
+
+
+class RequestPlanner:
+    """Tracks what earlier stages already know about a place and plans only the missing calls
+
+    ``naive`` counts the calls the unplanned flow would have made, per
+    endpoint. Calls actually issued are read from the ``client``'s
+    transport counters when the run is reported: every request put on the
+    wire counts, even if its caller was cancelled before the answer came
+    back, while lookups cancelled before they were sent and answers from
+    the response cache don't. Endpoints the planner never plans (e.g.
+    nearby searches) are issued by both flows alike.
+    """
+
+    def __init__(self, client=None):
+        self.naive = Counter()
+        self._client = client
+        self._sent_before = Counter(client.sent) if client is not None else Counter()
+
+    def issued(self) -> Counter:
+        """Calls sent since this planner was created"""
+        if self._client is None:
+            return Counter()
+        return self._client.sent - self._sent_before
+
+    def plan_lookup(self, place: Dict) -> bool:
+        """Whether a text search is still needed to resolve the place_id"""
+        self.naive['textsearch'] += 1
+        return not place.get('place_id')
+
+    def plan_details(self, place: Dict, fields: List[str], calls: int = 1) -> List[str]:
+        """Fields not yet known for ``place``; empty means the details call can be skipped
+
+        ``calls`` is how many details calls the unplanned flow makes for a
+        place, e.g. one per review variant when reviews are harvested.
+        """
+        self.naive['details'] += calls
+        return [field for field in fields if result_key(field) not in place]
+
+    def plan_prefetch(self, place: Dict, fields: List[str]) -> List[str]:
+        """Like plan_details, for an extra cheap stage the unplanned flow never made"""
+        return [field for field in fields if result_key(field) not in place]
+
+    def skip_details(self, calls: int = 1):
+        """Count details calls the unplanned flow would have made but this run ruled out"""
+        self.naive['details'] += calls
+
+    def report(self):
+        issued = self.issued()
+        naive = Counter(self.naive)
+        for endpoint, count in issued.items():
+            if endpoint not in self.naive:
+                naive[endpoint] = count
+        total_naive, total_issued = sum(naive.values()), sum(issued.values())
+        print(f"\n📊 API calls this run: {total_issued} issued vs {total_naive} unplanned "
+              f"({total_naive - total_issued} skipped)")
+        for endpoint in sorted(naive):
+            print(f"   {endpoint}: {issued[endpoint]} / {naive[endpoint]}")
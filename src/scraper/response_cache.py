@@ -0,0 +1,146 @@
+import json
+import os
+import sqlite3
+import time
+import zlib
+from typing import Awaitable, Callable, Dict, List
+
+from .field_masks import result_key
+
+# Detail fields that change often enough to need their own, shorter TTL
+FAST_FIELDS = {
+    'rating', 'reviews', 'user_ratings_total', 'business_status',
+    'opening_hours', 'current_opening_hours', 'secondary_opening_hours'
+}
+
+# Request params that do not change the response
+_IGNORED_PARAMS = {'key', 'sessiontoken'}
+
+# Only details are cached: search pages hand out next_page_tokens that expire
+CACHED_ENDPOINTS = {'details'}
+
+
+class OfflineCacheMiss(Exception):
+    """Raised in offline mode when a request is not in the cache"""
+
+
+class ResponseCache:
+    """Read-through SQLite cache of raw Places responses
+
+    Details responses are keyed on (endpoint, place_id, fields, language,
+    reviews_sort, ...) and every field carries its own fetch time: slow
+    fields (name, address) live for ``slow_ttl`` seconds and FAST_FIELDS
+    (reviews, rating) for ``fast_ttl``. When only some fields are stale,
+    only those are re-fetched and merged back. Searches, responses
+    carrying a ``next_page_token`` and ``reviews_sort='newest'`` lookups,
+    which exist to catch reviews posted since the last run, always go to
+    the API. Bodies are stored zlib-compressed; the database runs in WAL
+    mode so several processes can read it while one writes.
+    """
+
+    def __init__(self, path: str = '.cache/responses.sqlite', fast_ttl: float = 86400,
+                 slow_ttl: float = 30 * 86400, offline: bool = False):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.fast_ttl = fast_ttl
+        self.slow_ttl = slow_ttl
+        self.offline = offline
+        self.hits = 0
+        self.misses = 0
+        self.partial_refreshes = 0
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.execute('''
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                endpoint TEXT NOT NULL,
+                field_times TEXT NOT NULL,
+                body BLOB NOT NULL
+            )
+        ''')
+        self._db.commit()
+
+    def close(self):
+        self._db.close()
+
+    @staticmethod
+    def make_key(endpoint: str, params: Dict) -> str:
+        key_params = {k: v for k, v in params.items() if k not in _IGNORED_PARAMS}
+        if 'fields' in key_params:
+            key_params['fields'] = ','.join(sorted(key_params['fields'].split(',')))
+        return json.dumps([endpoint, sorted(key_params.items())], default=str)
+
+    def _load(self, key: str):
+        row = self._db.execute(
+            'SELECT field_times, body FROM responses WHERE key = ?', (key,)
+        ).fetchone()
+        if row is None:
+            return None, None
+        return json.loads(row[0]), json.loads(zlib.decompress(row[1]))
+
+    def _store(self, key: str, endpoint: str, field_times: Dict, body: Dict):
+        self._db.execute(
+            'INSERT OR REPLACE INTO responses (key, endpoint, field_times, body) VALUES (?, ?, ?, ?)',
+            (key, endpoint, json.dumps(field_times), zlib.compress(json.dumps(body).encode('utf-8')))
+        )
+        self._db.commit()
+
+    def _ttl(self, field: str) -> float:
+        # Whole-response entries ('*') are details fetched without a field mask
+        if field == '*' or result_key(field) in FAST_FIELDS:
+            return self.fast_ttl
+        return self.slow_ttl
+
+    def _stale_fields(self, field_times: Dict, now: float) -> List[str]:
+        return [field for field, fetched_at in field_times.items() if now - fetched_at > self._ttl(field)]
+
+    @staticmethod
+    def cacheable(endpoint: str, params: Dict) -> bool:
+        return endpoint in CACHED_ENDPOINTS and params.get('reviews_sort') != 'newest'
+
+    async def fetch(self, endpoint: str, params: Dict,
+                    send: Callable[[Dict], Awaitable[Dict]]) -> Dict:
+        """Serve ``params`` from the cache, calling ``send`` only for what is missing or stale"""
+        if not self.cacheable(endpoint, params):
+            if self.offline:
+                raise OfflineCacheMiss(f"{endpoint} requests are never cached")
+            return await send(params)
+
+        key = self.make_key(endpoint, params)
+        field_times, body = self._load(key)
+        now = time.time()
+        fields = params['fields'].split(',') if endpoint == 'details' and params.get('fields') else None
+
+        if body is not None:
+            stale = self._stale_fields(field_times, now)
+            if not stale or self.offline:
+                self.hits += 1
+                return body
+        elif self.offline:
+            raise OfflineCacheMiss(f"{endpoint} request not cached: {key}")
+
+        if body is not None and fields and len(stale) < len(fields):
+            # Only re-fetch the stale fields and merge them into the cached result
+            self.partial_refreshes += 1
+            fresh = await send(dict(params, fields=','.join(stale)))
+            result = body.setdefault('result', {})
+            for field in stale:
+                result.pop(result_key(field), None)
+            result.update(fresh.get('result', {}))
+            body['status'] = fresh.get('status', body.get('status'))
+            field_times.update({field: now for field in stale})
+        else:
+            self.misses += 1
+            body = await send(params)
+            field_times = {field: now for field in (fields or ['*'])}
+
+        if 'next_page_token' not in body:
+            self._store(key, endpoint, field_times, body)
+        return body
+
+    def report(self):
+        print(f"🗄️ Response cache: {self.hits} hits, {self.misses} misses, "
+              f"{self.partial_refreshes} partial refreshes")
@@ -0,0 +1,40 @@
+import asyncio
+import copy
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Coalesces concurrent identical calls onto one in-flight task
+
+    The first caller for a key starts the work; callers arriving while it
+    runs await the same task and get their own copy of its result. The task
+    is shielded, so one caller being cancelled does not fail the others.
+    """
+
+    def __init__(self):
+        self.coalesced = 0
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return copy.deepcopy(await asyncio.shield(task))
+
+        task = asyncio.ensure_future(call())
+        self._in_flight[key] = task
+
+        def finished(done: asyncio.Task):
+            self._in_flight.pop(key, None)
+            if not done.cancelled():
+                done.exception()  # Mark retrieved even if every caller was cancelled
+
+        task.add_done_callback(finished)
+        return await asyncio.shield(task)
+
+    def cancel_all(self):
+        for task in list(self._in_flight.values()):
+            task.cancel()
+
+    def report(self):
+        print(f"🤝 Single-flight: {self.coalesced} duplicate in-flight requests coalesced")
@@ -13,27 +13,34 @@ async def test_delta_scraper():
     if not api_key:
         raise ValueError("Google Maps API key not found in .env.local")
     
-    scraper = GoogleReviewScraper(api_key)
+    config = GoogleAPIConfig(api_key=api_key, warm_up_connections=8, skip_unchanged=True)
+    if os.getenv('GOOGLE_MAPS_BASE_URL'):  # e.g. a local mock server
+        config.base_url = os.getenv('GOOGLE_MAPS_BASE_URL')
+    # PLACES_CASSETTE=record captures Places traffic, =replay serves it back without network
+    config.cassette_mode = os.getenv('PLACES_CASSETTE') or None
+    config.cassette_time_scale = float(os.getenv('PLACES_CASSETTE_TIME_SCALE', '1'))
+    async with GoogleReviewScraper(api_key, config) as scraper:
+        # Test with manufacturing businesses first
+        print("🔍 Fetching employment-related reviews in Delta, BC...")
+        print("📍 Focusing on manufacturing sector...")
+        
+        # Print each review as soon as its place is looked up
+        count = 0
+        async for review in scraper.iter_reviews(
+            business_type="manufacturing",
+            max_results=5  # Starting with a small sample
+        ):
+            count += 1
+            print(f"\n📝 --- Review {count} ---")
+            print(f"🏢 Business: {review['business_name']}")
+            print(f"📍 Address: {review['address']}")
+            print(f"⭐ Rating: {review['rating']} stars")
+            print(f"🕒 Time: {review['time']}")
+            print(f"💬 Review: {review['text'][:200]}..." if len(review['text']) > 200 else f"💬 Review: {review['text']}")
+            print("-" * 80)
+    await scraper.http_pool.close()
     
-    # Test with manufacturing businesses first
-    print("🔍 Fetching employment-related reviews in Delta, BC...")
-    print("📍 Focusing on manufacturing sector...")
-    
-    reviews = await scraper.get_delta_bc_reviews(
-        business_type="manufacturing",
-        max_results=5  # Starting with a small sample
-    )
-    
-    # Display results
-    print(f"\n✨ Found {len(reviews)} employment-related reviews:")
-    for i, review in enumerate(reviews, 1):
-        print(f"\n📝 --- Review {i} ---")
-        print(f"🏢 Business: {review['business_name']}")
-        print(f"📍 Address: {review['address']}")
-        print(f"⭐ Rating: {review['rating']} stars")
-        print(f"🕒 Time: {review['time']}")
-        print(f"💬 Review: {review['text'][:200]}..." if len(review['text']) > 200 else f"💬 Review: {review['text']}")
-        print("-" * 80)
+    print(f"\n✨ Found {count} employment-related reviews")
 
 if __name__ == "__main__":
     try:
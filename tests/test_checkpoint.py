@@ -0,0 +1,42 @@
+from src.scraper.checkpoint import CheckpointJournal
+
+
+def write_journal(path, keys):
+    journal = CheckpointJournal(str(path))
+    for key in keys:
+        journal.put('place', key, {'reviews': [key]})
+    journal.close()
+
+
+def test_resume_recovers_entries_before_a_torn_line(tmp_path):
+    path = tmp_path / 'run.jsonl'
+    write_journal(path, 'abcde')
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"kind": "place", "key": "f", "val')  # Crashed mid-write
+
+    journal = CheckpointJournal(str(path), resume=True)
+    assert [journal.get('place', key) for key in 'abcde'] == [{'reviews': [key]} for key in 'abcde']
+    assert journal.get('place', 'f') is None
+
+    # New entries must not be glued onto the torn line and lost with it on the next resume
+    journal.put('place', 'f', {'reviews': ['f']})
+    journal.close()
+    resumed = CheckpointJournal(str(path), resume=True)
+    assert [resumed.get('place', key) for key in 'abcdef'] == [{'reviews': [key]} for key in 'abcdef']
+    resumed.close()
+
+
+def test_without_resume_an_old_journal_is_discarded(tmp_path):
+    path = tmp_path / 'run.jsonl'
+    write_journal(path, 'ab')
+    journal = CheckpointJournal(str(path))
+    assert journal.get('place', 'a') is None
+    journal.close()
+
+
+def test_finish_deletes_the_journal(tmp_path):
+    path = tmp_path / 'run.jsonl'
+    journal = CheckpointJournal(str(path))
+    journal.put('row', 'a', True)
+    journal.finish()
+    assert not path.exists()
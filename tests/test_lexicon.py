@@ -0,0 +1,66 @@
+import random
+import string
+
+from src.scraper.google_review_scraper import GoogleReviewScraper
+from src.scraper.lexicon import Lexicon
+
+LEXICON = GoogleReviewScraper.EMPLOYMENT_KEYWORDS
+
+
+def substring_score(weights, text):
+    """filter_employment_keywords as it was: one ``keyword in text`` scan per keyword"""
+    text = text.lower()
+    return sum(weight for keyword, weight in weights.items() if keyword in text)
+
+
+def fuzzed_texts(count, terms, seed=0):
+    """Texts built from whole terms, cut-up terms, case changes and noise"""
+    rng = random.Random(seed)
+    noise = string.ascii_letters + string.digits + ' .,!?-\'\n' + 'éÉßİ'
+    texts = []
+    for _ in range(count):
+        pieces = []
+        for _ in range(rng.randint(0, 12)):
+            term = rng.choice(terms)
+            roll = rng.random()
+            if roll < 0.3:
+                pieces.append(term)
+            elif roll < 0.5:
+                pieces.append(term.upper() if rng.random() < 0.5 else term.title())
+            elif roll < 0.7:
+                start = rng.randrange(len(term))
+                pieces.append(term[start:rng.randint(start + 1, len(term))])
+            else:
+                pieces.append(''.join(rng.choices(noise, k=rng.randint(1, 8))))
+        texts.append(rng.choice(['', ' ']).join(pieces))
+    return texts
+
+
+def test_scores_match_substring_scan_on_fuzzed_texts():
+    weights = LEXICON.weights
+    for text in fuzzed_texts(20000, list(weights)):
+        expected = substring_score(weights, text)
+        result = LEXICON.scan(text)
+        assert result.score == expected, text
+        assert LEXICON.reaches(text, 1.0) == (expected >= 1.0), text
+        assert {term for term, _ in result.matches} == {term for term in weights if term in text.lower()}, text
+
+
+def test_matches_report_every_occurrence_with_its_position():
+    lexicon = Lexicon({'work': 1, 'worker': 2, 'ker': 0.5})
+    text = 'Coworkers WORK hard'
+    result = lexicon.scan(text)
+    assert result.score == 3.5
+    assert result.matches == [('work', 2), ('worker', 2), ('ker', 5), ('work', 10)]
+    for term, start in result.matches:
+        assert text.lower()[start:start + len(term)] == term
+
+
+def test_grown_lexicon_matches_substring_scan():
+    rng = random.Random(1)
+    weights = dict(LEXICON.weights)
+    while len(weights) < 300:
+        weights[''.join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6)))] = rng.choice([0.5, 1, 2])
+    lexicon = Lexicon(weights)
+    for text in fuzzed_texts(2000, list(weights), seed=2):
+        assert lexicon.scan(text).score == substring_score(weights, text), text
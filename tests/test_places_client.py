@@ -0,0 +1,105 @@
+import asyncio
+
+import googlemaps
+import pytest
+
+from src.config.api_config import GoogleAPIConfig
+from src.scraper import places_client
+from src.scraper.field_masks import params_skus
+from src.scraper.google_review_scraper import GoogleReviewScraper
+from src.scraper.key_pool import KeyPool, PooledKey
+from src.scraper.places_client import AsyncPlacesClient
+from src.scraper.quota_ledger import BudgetExhausted, QuotaLedger
+from src.scraper.rate_limiter import RateLimiter
+
+
+class FakeTransport:
+    """Stands in for AsyncPlacesClient._get; place_ids in ``failing`` get HTTP 500"""
+
+    def __init__(self, failing=(), latency=0.05):
+        self.failing = set(failing)
+        self.latency = latency
+        self.sent = []
+
+    async def __call__(self, session, request_url):
+        self.sent.append(request_url.query.get('placeid'))
+        await asyncio.sleep(self.latency)
+        if request_url.query.get('placeid') in self.failing:
+            raise googlemaps.exceptions.HTTPError(500)
+        return {'status': 'OK', 'result': {'name': request_url.query.get('placeid')}}
+
+
+def attach(client, transport):
+    async def no_session():
+        return None
+    client._get = transport
+    client._get_session = no_session
+
+
+def details_cost(ledger):
+    return ledger.cost(params_skus('details', {'fields': 'name'}))
+
+
+async def concurrent_lookups(client, count):
+    return await asyncio.gather(
+        *(client.place(f'place_{i}', fields=['name']) for i in range(count)), return_exceptions=True)
+
+
+def test_concurrent_calls_stop_at_the_daily_budget(tmp_path):
+    async def run():
+        ledger = QuotaLedger(str(tmp_path / 'probe.sqlite'))
+        config = GoogleAPIConfig(api_key='AIzaTEST', cache_dir=str(tmp_path),
+                                 daily_budget=3 * details_cost(ledger) + 1e-9)
+        ledger.close()
+        scraper = GoogleReviewScraper('AIzaTEST', config)
+        transport = FakeTransport()
+        attach(scraper.places, transport)
+        try:
+            return transport, await concurrent_lookups(scraper.places, 16)
+        finally:
+            await scraper.close()
+
+    transport, results = asyncio.run(run())
+    assert len(transport.sent) == 3
+    assert sum(isinstance(result, BudgetExhausted) for result in results) == 13
+
+
+def test_concurrent_calls_stop_at_a_keys_own_budget(tmp_path):
+    async def run():
+        ledger = QuotaLedger(str(tmp_path / 'quota_ledger.sqlite'))
+        pool = KeyPool([PooledKey('AIzaTEST', RateLimiter(1000), 3 * details_cost(ledger) + 1e-9)], ledger=ledger)
+        client = AsyncPlacesClient('AIzaTEST', key_pool=pool, max_retries=0)
+        transport = FakeTransport()
+        attach(client, transport)
+        try:
+            return transport, pool, await concurrent_lookups(client, 16)
+        finally:
+            ledger.close()
+
+    transport, pool, results = asyncio.run(run())
+    assert len(transport.sent) == 3
+    assert sum(isinstance(result, BudgetExhausted) for result in results) == 13
+    assert pool.keys[0].reserved == 0
+
+
+def test_one_failing_place_does_not_trip_the_breaker(tmp_path, monkeypatch):
+    monkeypatch.setattr(places_client, 'backoff_delay', lambda attempt: 0)
+
+    async def run():
+        scraper = GoogleReviewScraper('AIzaTEST', GoogleAPIConfig(api_key='AIzaTEST', cache_dir=str(tmp_path)))
+        transport = FakeTransport(failing={'broken'}, latency=0)
+        attach(scraper.places, transport)
+        try:
+            with pytest.raises(googlemaps.exceptions.HTTPError):
+                await scraper.places.place('broken', fields=['name'])
+            attempts = len(transport.sent)
+            state = scraper.places.controller.state
+            healthy = await scraper.places.place('healthy', fields=['name'])
+            return attempts, state, healthy
+        finally:
+            await scraper.close()
+
+    attempts, state, healthy = asyncio.run(run())
+    assert attempts == GoogleAPIConfig(api_key='AIzaTEST').max_retries + 1
+    assert state == 'closed'
+    assert healthy['result']['name'] == 'healthy'